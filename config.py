@@ -3,20 +3,27 @@ Global Config
 """
 
 from os import getenv, path
+from functools import lru_cache
+from typing import TYPE_CHECKING
 import logging
 
-import sqlalchemy as sa
 from celery import Celery
 
+if TYPE_CHECKING:
+    import sqlalchemy as sa
 
+
+@lru_cache(maxsize=8)
 def get_db_uri(
     dbname: str,
     username_env="AUTOPKG_POSTGRES_USER",
     password_env="AUTOPKG_POSTGRES_PASSWORD",
     host_env="AUTOPKG_POSTGRES_HOST",
     port_env="AUTOPKG_POSTGRES_PORT",
-) -> sa.engine.URL:
-    """Standard user DBURI"""
+) -> "sa.engine.URL":
+    """Standard user DBURI (cached per dbname and env var names - URLs are immutable)"""
+    import sqlalchemy as sa
+
     return sa.engine.URL.create(
         drivername="postgresql+asyncpg",
         username=getenv(username_env),
@@ -27,14 +34,17 @@ def get_db_uri(
     )
 
 
+@lru_cache(maxsize=8)
 def get_db_uri_ogr(
     dbname: str,
     username_env="AUTOPKG_POSTGRES_USER",
     password_env="AUTOPKG_POSTGRES_PASSWORD",
     host_env="AUTOPKG_POSTGRES_HOST",
     port_env="AUTOPKG_POSTGRES_PORT",
-) -> sa.engine.URL:
+) -> "sa.engine.URL":
     """Standard user DBURI for use with OGR (no psycopg2)"""
+    import sqlalchemy as sa
+
     for var in [username_env, password_env, host_env, port_env]:
         if not getenv(var):
             raise Exception(f"Environment failed to parse - check var: {var}")
@@ -48,14 +58,17 @@ def get_db_uri_ogr(
     )
 
 
+@lru_cache(maxsize=8)
 def get_db_uri_sync(
     dbname: str,
     username_env="AUTOPKG_POSTGRES_USER",
     password_env="AUTOPKG_POSTGRES_PASSWORD",
     host_env="AUTOPKG_POSTGRES_HOST",
     port_env="AUTOPKG_POSTGRES_PORT",
-) -> sa.engine.URL:
+) -> "sa.engine.URL":
     """Standard user DBURI - non-async"""
+    import sqlalchemy as sa
+
     return sa.engine.URL.create(
         drivername="postgresql+psycopg2",
         username=getenv(username_env),
@@ -134,8 +147,19 @@ else:
     S3_BUCKET = getenv("AUTOPKG_S3_BUCKET", "irv-autopkg")
     S3_REGION = getenv("AUTOPKG_S3_REGION", "eu-west-2")
 
+
+def __getattr__(name: str):
+    """
+    Lazily resolved module attributes
+
+    DBURI_API is built on first access so importing config does not pull in sqlalchemy
+    """
+    if name == "DBURI_API":
+        return get_db_uri(API_POSTGRES_DB)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Initialised Startup Data
-DBURI_API = get_db_uri(API_POSTGRES_DB)
 CELERY_APP = Celery(
     "AutoPackage",
     worker_prefetch_multiplier=1,  # Do not change - long running tasks require this. See: https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-worker_prefetch_multiplier
@@ -152,3 +176,9 @@ TASK_EXPIRY_SECS = int(getenv("AUTOPKG_TASK_EXPIRY_SECS", "3600"))
 INCLUDE_TEST_PROCESSORS = (
     True if getenv("AUTOPKG_INCLUDE_TEST_PROCESSORS", "True") == "True" else False
 )
+
+# Seconds test processors pause during generate (to allow inspection of executing tasks).  Default no pause.
+TEST_PROCESSOR_SLEEP_SECS = int(getenv("AUTOPKG_TEST_PROCESSOR_SLEEP_SECS", "0"))
+
+# Optional folder in which downloaded source files are cached by URL (persists across processing / test runs).  Default disabled.
+DOWNLOAD_CACHE_DIR = getenv("AUTOPKG_DOWNLOAD_CACHE_DIR", "")
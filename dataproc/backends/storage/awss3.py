@@ -4,6 +4,7 @@ AWS S3 Filesystem Backend
 
 import os
 from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import json
 from datetime import datetime
 import warnings
@@ -228,7 +229,7 @@ class AWSS3StorageBackend(StorageBackend):
             log = {datetime.utcnow().isoformat(): processing_log}
             with S3Manager(*self._parse_env(), region=self.s3_region) as s3_fs:
                 with s3_fs.open_output_stream(dest_abs_path) as stream:
-                    stream.write(json.dumps(log).encode())
+                    stream.write(json.dumps(log, separators=(",", ":")).encode())
         else:
             # If exist - fetch, update and upload (overwrite)
             with S3Manager(*self._parse_env(), region=self.s3_region) as s3_fs:
@@ -236,7 +237,7 @@ class AWSS3StorageBackend(StorageBackend):
                     log = json.loads(stream.readall().decode())
                     log[datetime.utcnow().isoformat()] = processing_log
                 with s3_fs.open_output_stream(dest_abs_path) as stream:
-                    stream.write(json.dumps(log).encode())
+                    stream.write(json.dumps(log, separators=(",", ":")).encode())
         return True
 
     def boundary_folder_exists(self, boundary_name: str):
@@ -253,6 +254,25 @@ class AWSS3StorageBackend(StorageBackend):
         """If a given file for a boundary exists"""
         return self._exists(self._build_absolute_path(boundary_name, filename))
 
+    def boundary_files_exist(self, boundary_name: str, filenames: List[str]) -> dict:
+        """
+        Whether each of the given files for a boundary exist, using a single listing of the boundary folder
+
+        ::returns exists dict {filename: bool}
+        """
+        with S3Manager(*self._parse_env(), region=self.s3_region) as s3_fs:
+            contents = s3_fs.get_file_info(
+                fs.FileSelector(
+                    self._build_absolute_path(boundary_name),
+                    recursive=False,
+                    allow_not_found=True,
+                )
+            )
+            existing = set(
+                item.base_name for item in contents if item.type == fs.FileType.File
+            )
+        return {filename: filename in existing for filename in filenames}
+
     def create_boundary_folder(self, boundary_name: str):
         """
         Create a boundary folder
@@ -297,6 +317,60 @@ class AWSS3StorageBackend(StorageBackend):
                 f"destination file path {dest_abs_path} not found after creation attempt"
             )
 
+    def put_boundary_data_bytes(
+        self,
+        boundary_name: str,
+        filename: str,
+        data: bytes,
+    ):
+        """Write boundary supporting data directly onto the backend from memory"""
+        dest_abs_path = self._build_absolute_path(boundary_name, filename)
+        with S3Manager(*self._parse_env(), region=self.s3_region) as s3_fs:
+            with s3_fs.open_output_stream(dest_abs_path) as stream:
+                stream.write(data)
+        if not self._exists(dest_abs_path):
+            raise FileCreationException(
+                f"destination file path {dest_abs_path} not found after creation attempt"
+            )
+
+    def put_boundary_data_bulk(
+        self,
+        local_source_fpaths: List[str],
+        boundary_name: str,
+        max_workers: int = 4,
+    ):
+        """
+        Put multiple boundary supporting data files onto the backend
+
+        Uploads run concurrently over a single S3 connection,
+            then are verified with a single listing of the boundary folder
+        """
+        with S3Manager(*self._parse_env(), region=self.s3_region) as s3_fs:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        fs.copy_files,
+                        local_source_fpath,
+                        self._build_absolute_path(
+                            boundary_name, os.path.basename(local_source_fpath)
+                        ),
+                        source_filesystem=fs.LocalFileSystem(),
+                        destination_filesystem=s3_fs,
+                    )
+                    for local_source_fpath in local_source_fpaths
+                ]
+                for future in futures:
+                    future.result()
+        files_exist = self.boundary_files_exist(
+            boundary_name,
+            [os.path.basename(fpath) for fpath in local_source_fpaths],
+        )
+        missing = [filename for filename, exists in files_exist.items() if not exists]
+        if missing:
+            raise FileCreationException(
+                f"destination files {missing} for boundary {boundary_name} not found after creation attempt"
+            )
+
     def processor_dataset_exists(
         self, boundary_name: str, processor_dataset: str, version: str
     ) -> bool:
@@ -427,15 +501,17 @@ class AWSS3StorageBackend(StorageBackend):
                 ]
             )
 
-    def count_boundary_data_files(
+    def list_boundary_data_files(
         self,
         boundary_name: str,
         dataset_name: str,
         version: str,
         datafile_ext: str = ".tif",
-    ) -> int:
+    ) -> List[str]:
         """
-        Count the number of datafiles for a given boundary folder
+        List the filenames of datafiles for a given boundary folder
+
+        Enables callers to check and act-on existing outputs with a single listing
         """
         folder = self._build_absolute_path(
             boundary_name,
@@ -446,14 +522,28 @@ class AWSS3StorageBackend(StorageBackend):
         )
         with S3Manager(*self._parse_env(), region=self.s3_region) as s3_fs:
             contents = s3_fs.get_file_info(fs.FileSelector(folder, recursive=False))
-            return len(
-                [
-                    item
-                    for item in contents
-                    if item.type == fs.FileType.File
-                    and item.extension == datafile_ext.replace(".", "")
-                ]
+            return [
+                item.base_name
+                for item in contents
+                if item.type == fs.FileType.File
+                and item.extension == datafile_ext.replace(".", "")
+            ]
+
+    def count_boundary_data_files(
+        self,
+        boundary_name: str,
+        dataset_name: str,
+        version: str,
+        datafile_ext: str = ".tif",
+    ) -> int:
+        """
+        Count the number of datafiles for a given boundary folder
+        """
+        return len(
+            self.list_boundary_data_files(
+                boundary_name, dataset_name, version, datafile_ext=datafile_ext
             )
+        )
 
     def remove_boundary_data_files(
         self,
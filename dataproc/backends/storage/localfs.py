@@ -53,45 +53,35 @@ class LocalFSStorageBackend(StorageBackend):
         }
         ::kwarg summary bool Return only boundary names (packages), not included dataset_versions
         """
-        tree = {}
-        for _, dirs, _ in os.walk(os.path.join(self.top_level_folder_path)):
-            # First level packages
-            for package in dirs:
-                tree[package] = {}
-            # Dont recurse further
-            break
+        # First level packages
+        tree = {
+            package: {} for package in self._subfolder_names(self.top_level_folder_path)
+        }
         if summary is True:
             return tree
-        # Descend into datasets
-        for package, _ in tree.items():
-            for _, dataset_dirs, _ in os.walk(
-                os.path.join(
-                    self.top_level_folder_path,
-                    package,
-                    self.datasets_folder_name,
+        # Descend into datasets and their versions
+        for package, datasets in tree.items():
+            datasets_path = self._build_absolute_path(package, self.datasets_folder_name)
+            for dataset in self._subfolder_names(datasets_path):
+                datasets[dataset] = self._subfolder_names(
+                    os.path.join(datasets_path, dataset)
                 )
-            ):
-                for dataset in dataset_dirs:
-                    tree[package][dataset] = []
-                # Dont recurse further
-                break
-        # Descend into versions
-        for package, _ in tree.items():
-            for dataset, _ in tree[package].items():
-                for _, version_dirs, _ in os.walk(
-                    os.path.join(
-                        self.top_level_folder_path,
-                        package,
-                        self.datasets_folder_name,
-                        dataset,
-                    )
-                ):
-                    for version in version_dirs:
-                        tree[package][dataset].append(version)
-                    # Dont recurse further
-                    break
         return tree
 
+    @staticmethod
+    def _subfolder_names(folder_path: str) -> List[str]:
+        """
+        Names of the immediate sub-folders of the given folder
+
+        Uses the file type cached on each scandir entry, so no per-entry stat is required.
+            A missing (or unreadable) folder has no sub-folders
+        """
+        try:
+            with os.scandir(folder_path) as entries:
+                return [entry.name for entry in entries if entry.is_dir()]
+        except OSError:
+            return []
+
     def packages(self, summary: bool = False) -> List[str]:
         """List of Packages that currently exist under the top-level storage backend"""
         tree = self.tree(summary=summary)
@@ -104,12 +94,12 @@ class LocalFSStorageBackend(StorageBackend):
         ::param package str The name of the package
             (which maps directly to a Boundary name)
         """
-        tree = self.tree()
-        try:
-            return list(tree[package].keys())
-        except KeyError:
+        if package not in self.packages(summary=True):
             # The package does not exist
             raise PackageNotFoundException(f"{package}")
+        return self._subfolder_names(
+            self._build_absolute_path(package, self.datasets_folder_name)
+        )
 
     def dataset_versions(self, package: str, dataset: str) -> List[str]:
         """
@@ -120,12 +110,14 @@ class LocalFSStorageBackend(StorageBackend):
 
         ::param dataset str the name of the dataset for which to retrieve versions
         """
-        tree = self.tree()
-        try:
-            return tree[package][dataset]
-        except KeyError:
+        if package not in self.packages(summary=True):
             # The dataset does not exist
             raise DatasetNotFoundException(f"{dataset}")
+        datasets_path = self._build_absolute_path(package, self.datasets_folder_name)
+        if dataset not in self._subfolder_names(datasets_path):
+            # The dataset does not exist
+            raise DatasetNotFoundException(f"{dataset}")
+        return self._subfolder_names(os.path.join(datasets_path, dataset))
 
     def add_provenance(
         self,
@@ -144,13 +136,13 @@ class LocalFSStorageBackend(StorageBackend):
         if not os.path.exists(dest_abs_path):
             with open(dest_abs_path, "w") as fptr:
                 log = {datetime.utcnow().isoformat(): processing_log}
-                json.dump(log, fptr)
+                json.dump(log, fptr, separators=(",", ":"))
         else:
             with open(dest_abs_path, "r") as fptr:
                 log = json.load(fptr)
             log[datetime.utcnow().isoformat()] = processing_log
             with open(dest_abs_path, "w") as fptr:
-                json.dump(log, fptr)
+                json.dump(log, fptr, separators=(",", ":"))
         return os.path.exists(dest_abs_path)
 
     def boundary_folder_exists(self, boundary_name: str):
@@ -167,6 +159,18 @@ class LocalFSStorageBackend(StorageBackend):
         """If a given file for a boundary exists"""
         return os.path.exists(self._build_absolute_path(boundary_name, filename))
 
+    def boundary_files_exist(self, boundary_name: str, filenames: List[str]) -> dict:
+        """
+        Whether each of the given files for a boundary exist, using a single listing of the boundary folder
+
+        ::returns exists dict {filename: bool}
+        """
+        try:
+            existing = set(os.listdir(self._build_absolute_path(boundary_name)))
+        except FileNotFoundError:
+            existing = set()
+        return {filename: filename in existing for filename in filenames}
+
     def create_boundary_folder(self, boundary_name: str):
         """
         Create a boundary folder
@@ -199,6 +203,30 @@ class LocalFSStorageBackend(StorageBackend):
                 f"destination file path {dest_abs_path} not found after creation attempt"
             )
 
+    def put_boundary_data_bytes(
+        self,
+        boundary_name: str,
+        filename: str,
+        data: bytes,
+    ):
+        """Write boundary supporting data directly onto the backend from memory"""
+        dest_abs_path = self._build_absolute_path(boundary_name, filename)
+        with open(dest_abs_path, "wb") as fptr:
+            fptr.write(data)
+        if not os.path.exists(dest_abs_path):
+            raise FileCreationException(
+                f"destination file path {dest_abs_path} not found after creation attempt"
+            )
+
+    def put_boundary_data_bulk(
+        self,
+        local_source_fpaths: List[str],
+        boundary_name: str,
+    ):
+        """Put multiple boundary supporting data files onto the backend"""
+        for local_source_fpath in local_source_fpaths:
+            self.put_boundary_data(local_source_fpath, boundary_name)
+
     def processor_dataset_exists(
         self, boundary_name: str, processor_dataset: str, version: str
     ) -> bool:
@@ -256,13 +284,15 @@ class LocalFSStorageBackend(StorageBackend):
         )
         # Create the output dirs
         os.makedirs(os.path.dirname(dest_abs_path), exist_ok=True)
-        _ = shutil.copy(local_source_fpath, dest_abs_path)
+        if remove_local_source is True:
+            # Move rather than copy + remove - a rename when on the same filesystem
+            _ = shutil.move(local_source_fpath, dest_abs_path)
+        else:
+            _ = shutil.copy(local_source_fpath, dest_abs_path)
         if not os.path.exists(dest_abs_path):
             raise FileCreationException(
                 f"destination file path {dest_abs_path} not found after creation attempt"
             )
-        if remove_local_source is True:
-            os.remove(local_source_fpath)
         return self._build_uri(dest_abs_path)
 
     def put_processor_metadata(
@@ -312,15 +342,17 @@ class LocalFSStorageBackend(StorageBackend):
                 count += 1
         return count
 
-    def count_boundary_data_files(
+    def list_boundary_data_files(
         self,
         boundary_name: str,
         dataset_name: str,
         version: str,
         datafile_ext: str = ".tif",
-    ) -> int:
+    ) -> List[str]:
         """
-        Count the number of datafiles for a given boundary folder
+        List the filenames of datafiles for a given boundary folder
+
+        Enables callers to check and act-on existing outputs with a single listing
         """
         folder = self._build_absolute_path(
             boundary_name,
@@ -331,7 +363,28 @@ class LocalFSStorageBackend(StorageBackend):
         )
         if not os.path.exists(folder):
             raise FileNotFoundError()
-        return self.count_file_types_in_folder(folder, datafile_ext)
+        with os.scandir(folder) as entries:
+            return [
+                dir_info.name
+                for dir_info in entries
+                if os.path.splitext(dir_info.name)[1] == datafile_ext
+            ]
+
+    def count_boundary_data_files(
+        self,
+        boundary_name: str,
+        dataset_name: str,
+        version: str,
+        datafile_ext: str = ".tif",
+    ) -> int:
+        """
+        Count the number of datafiles for a given boundary folder
+        """
+        return len(
+            self.list_boundary_data_files(
+                boundary_name, dataset_name, version, datafile_ext=datafile_ext
+            )
+        )
 
     def remove_boundary_data_files(
         self,
@@ -349,15 +402,15 @@ class LocalFSStorageBackend(StorageBackend):
         )
         if not os.path.exists(folder):
             raise FileNotFoundError()
-        for filename in os.listdir(folder):
-            file_path = os.path.join(folder, filename)
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception as err:
-                print(f"Failed to delete {file_path}. Reason: {err}")
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() or entry.is_symlink():
+                        os.unlink(entry.path)
+                    elif entry.is_dir():
+                        shutil.rmtree(entry.path)
+                except Exception as err:
+                    print(f"Failed to delete {entry.path}. Reason: {err}")
 
     def update_datapackage(self, boundary_name: str, dp_resource: DataPackageResource):
         """
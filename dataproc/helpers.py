@@ -2,8 +2,11 @@
 Helper methods / classes
 """
 from enum import Enum
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+import hashlib
 import inspect
-from typing import Generator, List, Tuple
+from typing import ContextManager, Generator, List, Tuple, Union
 from types import ModuleType
 import os
 import requests
@@ -12,6 +15,7 @@ import json
 from subprocess import check_output, CalledProcessError, check_call
 import shutil
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 import csv
 import warnings
@@ -20,6 +24,7 @@ import rasterio
 from rasterio import sample
 import numpy as np
 
+from config import DOWNLOAD_CACHE_DIR
 from dataproc.processors.internal.base import BaseProcessorABC, BaseMetadataABC
 from dataproc.backends import StorageBackend
 from dataproc import Boundary, DataPackageLicense, DataPackageResource
@@ -67,6 +72,7 @@ def valid_processor(name: str, processor: BaseProcessorABC) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
 def version_name_from_file(filename: str):
     """
     Generate a version from the name of a processors version file
@@ -74,6 +80,7 @@ def version_name_from_file(filename: str):
     return os.path.basename(filename).replace(".py", "")
 
 
+@lru_cache(maxsize=None)
 def processor_name_from_file(filename: str):
     """
     Generate a processor from the name of the folder in-which the processor file resides
@@ -108,6 +115,7 @@ def list_processors(include_test_processors: bool=False) -> List[BaseProcessorAB
     return valid_processors
 
 
+@lru_cache(maxsize=128)
 def get_processor_by_name(processor_name_version: str) -> BaseProcessorABC:
     """Retrieve a processor module by its name (including version) and check its validity"""
     import dataproc.processors.core as available_processors
@@ -120,6 +128,7 @@ def get_processor_by_name(processor_name_version: str) -> BaseProcessorABC:
             return processor.Processor
 
 
+@lru_cache(maxsize=128)
 def get_processor_meta_by_name(processor_name_version: str) -> BaseProcessorABC:
     """Retrieve a processor MetaData module by its name (including version)"""
     import dataproc.processors.core as available_processors
@@ -314,30 +323,141 @@ def create_test_file(fpath: str):
         fptr.write("test\n")
 
 
+DOWNLOAD_HEADERS = {
+    "Accept": "application/zip",
+    "Accept-Encoding": "gzip",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36",
+}
+DOWNLOAD_RANGE_WORKERS = 8
+DOWNLOAD_RANGE_CHUNK_BYTES = 16 << 20
+
+
+@lru_cache(maxsize=1)
+def download_session() -> requests.Session:
+    """
+    Pooled HTTP session shared by downloads in this process
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=DOWNLOAD_RANGE_WORKERS, pool_maxsize=DOWNLOAD_RANGE_WORKERS
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _download_file_ranges(source_url: str, destination_fpath: str) -> bool:
+    """
+    Download a file using parallel HTTP Range requests, written in-place to a preallocated file
+
+    ::returns ok bool False if the server does not support ranged downloads,
+        any ranged request fails (the partial file is removed)
+        or the file is small enough that a single request is used
+    """
+    session = download_session()
+    headers = dict(DOWNLOAD_HEADERS, **{"Accept-Encoding": "identity"})
+    try:
+        head = session.head(source_url, timeout=5, allow_redirects=True, headers=headers)
+    except requests.RequestException:
+        return False
+    content_length = int(head.headers.get("Content-Length", 0))
+    if (
+        not head.ok
+        or head.headers.get("Accept-Ranges") != "bytes"
+        or content_length < 2 * DOWNLOAD_RANGE_CHUNK_BYTES
+    ):
+        return False
+    # Resolved once so chunk requests skip any redirects
+    resolved_url = head.url
+
+    def _fetch_range(start: int) -> bool:
+        end = min(start + DOWNLOAD_RANGE_CHUNK_BYTES, content_length) - 1
+        try:
+            with session.get(
+                resolved_url,
+                timeout=5,
+                stream=True,
+                headers=dict(headers, Range=f"bytes={start}-{end}"),
+            ) as r:
+                if r.status_code != 206:
+                    return False
+                offset = start
+                for chunk in r.iter_content(chunk_size=1 << 20):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+        except requests.RequestException:
+            return False
+        return offset == end + 1
+
+    results = [False]
+    try:
+        with open(destination_fpath, "wb") as fptr:
+            fptr.truncate(content_length)
+        fd = os.open(destination_fpath, os.O_WRONLY)
+        try:
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_RANGE_WORKERS) as executor:
+                results = list(
+                    executor.map(
+                        _fetch_range, range(0, content_length, DOWNLOAD_RANGE_CHUNK_BYTES)
+                    )
+                )
+        finally:
+            os.close(fd)
+    finally:
+        # Never leave a preallocated, partly zero-filled file behind
+        if not all(results) and os.path.exists(destination_fpath):
+            os.remove(destination_fpath)
+    return all(results)
+
+
 def download_file(source_url: str, destination_fpath: str) -> str:
     """
     Download a file from a source URL to a given destination
 
     Folders to the path will be created as required
+
+    Large files are fetched with parallel Range requests where the server supports them,
+        otherwise as a single streamed request
+
+    If AUTOPKG_DOWNLOAD_CACHE_DIR is configured the download is served from / stored in
+        a cache keyed by the source URL
     """
     os.makedirs(os.path.dirname(destination_fpath), exist_ok=True)
-    with requests.get(
-        source_url,
-        timeout=5,
-        stream=True,
-        headers={
-            "Accept": "application/zip",
-            "Accept-Encoding": "gzip",
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36",
-        },
-    ) as r:
-        with open(destination_fpath, "wb") as f:
-            shutil.copyfileobj(r.raw, f)
+    cache_fpath = None
+    if DOWNLOAD_CACHE_DIR:
+        cache_fpath = os.path.join(
+            DOWNLOAD_CACHE_DIR, hashlib.sha256(source_url.encode()).hexdigest()
+        )
+        if os.path.exists(cache_fpath):
+            shutil.copyfile(cache_fpath, destination_fpath)
+            return destination_fpath
+    download_ok = _download_file_ranges(source_url, destination_fpath)
+    if not download_ok:
+        with download_session().get(
+            source_url,
+            timeout=5,
+            stream=True,
+            headers=DOWNLOAD_HEADERS,
+        ) as r:
+            with open(destination_fpath, "wb") as f:
+                shutil.copyfileobj(r.raw, f)
+            download_ok = r.ok
 
     if not os.path.exists(destination_fpath):
         raise FileCreationException()
-    else:
-        return destination_fpath
+    if cache_fpath and download_ok:
+        # Populate the cache atomically so a partial copy is never served
+        #   the cache is only an optimisation - failing to write it does not fail the download
+        tmp_cache_fpath = f"{cache_fpath}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(DOWNLOAD_CACHE_DIR, exist_ok=True)
+            shutil.copyfile(destination_fpath, tmp_cache_fpath)
+            os.replace(tmp_cache_fpath, cache_fpath)
+        except OSError as err:
+            warnings.warn(f"failed to populate download cache for {source_url} due to: {err}")
+            if os.path.exists(tmp_cache_fpath):
+                os.remove(tmp_cache_fpath)
+    return destination_fpath
 
 
 def tiffs_in_folder(
@@ -448,11 +568,22 @@ def is_bigtiff(filename):
     version = struct.unpack(byteorder + "H", header[2:4])[0]
     return version == 43
 
-def sample_geotiff_coords(fpath: str, num_coords: int = 10) -> np.ndarray:
+def open_raster(raster: Union[str, rasterio.DatasetReader]) -> ContextManager:
+    """
+    Open the given raster filepath for reading,
+        or pass through an already open rasterio dataset (left open on exit)
+    """
+    if isinstance(raster, rasterio.DatasetReader):
+        return nullcontext(raster)
+    return rasterio.open(raster, 'r')
+
+def sample_geotiff_coords(fpath: Union[str, rasterio.DatasetReader], num_coords: int = 10) -> np.ndarray:
     """
     Retrieve a set of coordinates within the bounds of the given raster
+
+    ::param fpath str | DatasetReader Absolute filepath or open rasterio dataset
     """
-    with rasterio.open(fpath, 'r') as src:
+    with open_raster(fpath) as src:
         return np.column_stack((
             np.random.uniform(low=src.bounds.left, high=src.bounds.right, size=(num_coords,)),
             np.random.uniform(low=src.bounds.bottom, high=src.bounds.top, size=(num_coords,))
@@ -476,10 +607,11 @@ def sample_geotiff(fpath: str, coords: np.ndarray = None, num_samples: int = 10)
         return coords, [sample for sample in samples]
 
 def assert_geotiff(
-        fpath: str,
+        fpath: Union[str, rasterio.DatasetReader],
         check_crs: str = "EPSG:4326",
         check_compression=True,
         check_is_bigtiff=False,
+        check_is_cog=False,
         check_pixel_coords: np.ndarray=None,
         check_pixel_expected_samples: List[np.ndarray]=None
     ):
@@ -488,19 +620,28 @@ def assert_geotiff(
         Coordinate Reference System Match
         Compression exists (Any)
         The TIFF has BIGTIFF tags
+        The TIFF has a Cloud Optimized GeoTIFF (tiled) layout
         The TIFF pixels match some expected data samples at given coordinates
 
-    ::param fpath str Absolute filepath
+    ::param fpath str | DatasetReader Absolute filepath or open rasterio dataset
     """
-    with rasterio.open(fpath, 'r') as src:
+    with open_raster(fpath) as src:
+        fpath = src.name
         if check_crs is not None:
             assert (
                 src.meta["crs"] == check_crs
-            ), f"raster CRS {src.meta['crs']} doesnt not match expected {check_crs}"
+            ), f"raster CRS {src.meta['crs']} does not match expected {check_crs}"
         
         if check_compression is True:
             assert src.compression is not None, "raster did not have any compression"
 
+        if check_is_cog is True:
+            # GDAL (>=3.1) reports the COG layout for files written by the COG driver
+            assert (
+                src.tags(ns="IMAGE_STRUCTURE").get("LAYOUT") == "COG"
+            ), f"raster does not have a COG layout: {fpath}"
+            assert src.profile.get("tiled") is True, f"COG raster is not tiled: {fpath}"
+
         if check_pixel_coords is not None and check_pixel_expected_samples is not None:
             src_samples = sample.sample_gen(src, check_pixel_coords)
             for idx, src_sample in enumerate(src_samples):
@@ -513,15 +654,73 @@ def assert_geotiff(
     if check_is_bigtiff is True:
         assert is_bigtiff(fpath) is True, f"raster is not a bigtiff when it was expected to be: {fpath}"
 
+def raster_bounds_from_gdal(dataset) -> Tuple[float, float, float, float]:
+    """
+    Derive the bounds of an open GDAL raster dataset from its geotransform
+
+    ::returns bounds Tuple (minx, miny, maxx, maxy) in the CRS of the dataset
+    """
+    origin_x, pixel_width, _, origin_y, _, pixel_height = dataset.GetGeoTransform()
+    x_coords = (origin_x, origin_x + pixel_width * dataset.RasterXSize)
+    y_coords = (origin_y, origin_y + pixel_height * dataset.RasterYSize)
+    return min(x_coords), min(y_coords), max(x_coords), max(y_coords)
+
+def raster_bounds_disjoint(
+    raster_bounds: Tuple[float, float, float, float],
+    boundary_bounds: Tuple[float, float, float, float],
+) -> bool:
+    """
+    Whether two (minx, miny, maxx, maxy) bounding boxes do not overlap
+    """
+    return (
+        boundary_bounds[0] > raster_bounds[2]
+        or boundary_bounds[2] < raster_bounds[0]
+        or boundary_bounds[1] > raster_bounds[3]
+        or boundary_bounds[3] < raster_bounds[1]
+    )
+
+@contextmanager
+def gdal_config(config_options: dict) -> Generator[None, None, None]:
+    """
+    Apply GDAL config options for the duration of the context,
+        restoring any previous values on exit
+        (gdal.config_options is only available from GDAL 3.7)
+    """
+    from osgeo import gdal
+
+    previous = {key: gdal.GetConfigOption(key) for key in config_options}
+    try:
+        for key, value in config_options.items():
+            gdal.SetConfigOption(key, value)
+        yield
+    finally:
+        for key, value in previous.items():
+            gdal.SetConfigOption(key, value)
+
+
 def crop_raster(
     raster_input_fpath: str,
     raster_output_fpath: str,
     boundary: Boundary,
     creation_options=["COMPRESS=PACKBITS"],
-    debug=False
+    debug=False,
+    assert_valid=False,
+    check_crs: str = "EPSG:4326",
+    check_compression=True,
+    gdal_config_options: dict = None,
+    output_format: str = "GTiff",
 ) -> bool:
     """
     Crop a raster using GDAL translate
+
+    ::kwarg assert_valid bool Validate the input raster (as-per assert_geotiff)
+        using the same open handle as the crop, rather than opening the file separately
+    ::kwarg check_crs str CRS the input raster must match when assert_valid is set
+    ::kwarg check_compression bool Input raster must be compressed when assert_valid is set
+    ::kwarg gdal_config_options dict GDAL config options (e.g. {"GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR"})
+        applied to both the input inspection and the gdal_translate crop
+    ::kwarg output_format str GDAL output driver, e.g. "COG" to write a Cloud Optimized GeoTIFF
+        (tiled, with internal overviews).  creation_options must be valid for the given driver.
     """
     from osgeo import gdal
     import shapely
@@ -529,12 +728,25 @@ def crop_raster(
     from shapely.ops import transform
     import shlex
     import subprocess
-    
+
+    if gdal_config_options is None:
+        gdal_config_options = {}
     # # Gather the resolution
-    inds = gdal.Open(raster_input_fpath)
+    with gdal_config(gdal_config_options):
+        inds = gdal.Open(raster_input_fpath)
 
     source_boundary_crs = pyproj.CRS("EPSG:4326")
     target_boundary_crs = pyproj.crs.CRS.from_wkt(inds.GetProjection())
+    if assert_valid is True:
+        assert inds.RasterCount > 0, f"raster has no bands: {raster_input_fpath}"
+        if check_crs is not None:
+            assert (
+                target_boundary_crs == pyproj.CRS(check_crs)
+            ), f"raster CRS {target_boundary_crs} does not match expected {check_crs}"
+        if check_compression is True:
+            assert (
+                inds.GetMetadata("IMAGE_STRUCTURE").get("COMPRESSION") is not None
+            ), "raster did not have any compression"
     if source_boundary_crs != target_boundary_crs:
         # Reproject boundary to source raster for projwin
         project = pyproj.Transformer.from_crs(
@@ -547,13 +759,22 @@ def crop_raster(
         shape = shapely.from_geojson(json.dumps(boundary["envelope_geojson"]))
         bounds = shape.bounds
 
+    # Skip rasters which do not overlap the boundary at all - gdal_translate would fail for these anyway
+    if raster_bounds_disjoint(raster_bounds_from_gdal(inds), bounds):
+        if debug is True:
+            print ("Raster Crop Skipped - boundary does not intersect:", raster_input_fpath)
+        return False
+
     gdal_translate = shutil.which('gdal_translate')
     if not gdal_translate:
         raise Exception("gdal_translate not found")
-    cmd = f'{gdal_translate} -projwin {bounds[0]} {bounds[3]} {bounds[2]} {bounds[1]} {raster_input_fpath} {raster_output_fpath}'
+    cmd = f'{gdal_translate} -of {output_format} -projwin {bounds[0]} {bounds[3]} {bounds[2]} {bounds[1]} {raster_input_fpath} {raster_output_fpath}'
     # Add Creation Options
     for creation_option in creation_options:
         cmd = cmd + f' -co {creation_option}'
+    # Add Config Options
+    for config_key, config_value in gdal_config_options.items():
+        cmd = cmd + f' --config {config_key} {config_value}'
     if debug is True:
         print ("Raster Crop Command:", cmd)
 
@@ -592,12 +813,25 @@ def assert_vector_file(
 
 def ogr2ogr_load_shapefile_to_pg(shapefile_fpath: str, pg_uri: str):
     """
-    Load a shapefile into Postgres - uses system OGR command
+    Load a shapefile into Postgres - uses the GDAL VectorTranslate (ogr2ogr) bindings in-process
 
-    Uses the ogr2ogr -nlt PROMOTE_TO_MULTI flat
+    Uses the ogr2ogr -nlt PROMOTE_TO_MULTI flag.  New tables are populated using COPY.
+
+    Features are loaded in a single transaction (-gt unlimited),
+        so a failed load leaves no partial data behind
     """
-    cmd = f'ogr2ogr -f "PostgreSQL" -nlt PROMOTE_TO_MULTI PG:"{pg_uri}" "{shapefile_fpath}"'
-    os.system(cmd)
+    from osgeo import gdal
+
+    vector_options = gdal.VectorTranslateOptions(
+        options=["-gt", "unlimited"],
+        format="PostgreSQL",
+        geometryType="PROMOTE_TO_MULTI",
+    )
+    ds = gdal.VectorTranslate(f"PG:{pg_uri}", shapefile_fpath, options=vector_options)
+    if ds is None:
+        raise Exception(f"failed to load {shapefile_fpath} to PG: {gdal.GetLastErrorMsg()}")
+    # Dereference to flush and close the PG datasource
+    ds = None
 
 
 def gpkg_layer_name(pg_table_name: str, boundary: Boundary) -> str:
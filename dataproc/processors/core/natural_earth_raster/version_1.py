@@ -56,6 +56,9 @@ class Metadata(BaseMetadataABC):
 class Processor(BaseProcessorABC):
     """A Processor for Natural Earth"""
 
+    # Outputs are written as Cloud Optimized GeoTIFFs (tiled, with averaged overviews) for downstream tile reads
+    output_format = "COG"
+    output_creation_options = ["COMPRESS=DEFLATE", "BLOCKSIZE=256", "RESAMPLING=AVERAGE"]
     index_filename = "index.html"
     license_filename = "license.html"
     source_zip_filename = "NE2_50M_SR.zip"
@@ -86,7 +89,13 @@ class Processor(BaseProcessorABC):
             output_filename(self.metadata.name, self.metadata.version, self.boundary["name"], 'tif')
         )
         self.log.debug("Natural earth raster - cropping geotiff")
-        crop_success = crop_raster(geotiff_fpath, output_fpath, self.boundary)
+        crop_success = crop_raster(
+            geotiff_fpath,
+            output_fpath,
+            self.boundary,
+            creation_options=self.output_creation_options,
+            output_format=self.output_format,
+        )
         self.provenance_log[f"{self.metadata.name} - crop success"] = crop_success
         # Move cropped data to backend
         self.update_progress(80,"moving result")
@@ -1,5 +1,7 @@
 """
 Test Failing Processor
+
+Set AUTOPKG_TEST_PROCESSOR_SLEEP_SECS to pause generate (e.g. to inspect executing tasks)
 """
 
 from time import sleep
@@ -7,6 +9,7 @@ import os
 import inspect
 
 from dataproc import DataPackageLicense
+from config import TEST_PROCESSOR_SLEEP_SECS
 from dataproc.processors.internal.base import (
     BaseProcessorABC,
     BaseMetadataABC,
@@ -50,8 +53,9 @@ class Processor(BaseProcessorABC):
 
     def generate(self):
         """Generate files for a given processor"""
-        # Pause to allow inspection
-        sleep(1)
+        # Optionally pause to allow inspection
+        if TEST_PROCESSOR_SLEEP_SECS:
+            sleep(TEST_PROCESSOR_SLEEP_SECS)
         self.update_progress(30,"waiting")
         assert(0==1), "test-fail-processor failed as expected"
         return self.provenance_log
@@ -1,13 +1,17 @@
 """
 Test Raster Processor
+
+Set AUTOPKG_TEST_PROCESSOR_SLEEP_SECS to pause generate (e.g. to inspect executing tasks)
 """
 
 from time import sleep
+from functools import cached_property
 import os
 import inspect
 
 from dataproc import DataPackageLicense
 from dataproc.exceptions import ProcessorDatasetExists
+from config import TEST_PROCESSOR_SLEEP_SECS
 from dataproc.processors.internal.base import (
     BaseProcessorABC,
     BaseMetadataABC,
@@ -51,13 +55,11 @@ class Processor(BaseProcessorABC):
 
     def generate(self):
         """Generate files for a given processor"""
-        # Pause to allow inspection
-        sleep(1)
+        # Optionally pause to allow inspection
+        if TEST_PROCESSOR_SLEEP_SECS:
+            sleep(TEST_PROCESSOR_SLEEP_SECS)
         self.update_progress(30,"waiting")
-        output_folder = self.paths_helper.build_absolute_path(
-            "test_processor", self.metadata.version, "outputs"
-        )
-        output_fpath = os.path.join(output_folder, f"{self.boundary['name']}_test.tif")
+        output_fpath = os.path.join(self.output_folder, self.output_filename)
         if self.exists() is True:
             raise ProcessorDatasetExists()
         else:
@@ -88,5 +90,17 @@ class Processor(BaseProcessorABC):
             self.boundary["name"],
             self.metadata.name,
             self.metadata.version,
-            f"{self.boundary['name']}_test.tif",
+            self.output_filename,
+        )
+
+    @cached_property
+    def output_filename(self) -> str:
+        """Filename of the test output for the processor's boundary"""
+        return f"{self.boundary['name']}_test.tif"
+
+    @cached_property
+    def output_folder(self) -> str:
+        """Local folder the test output is generated in"""
+        return self.paths_helper.build_absolute_path(
+            "test_processor", self.metadata.version, "outputs"
         )
@@ -5,6 +5,7 @@ WRI Aqueduct Processor
 import os
 import inspect
 import shutil
+from typing import List
 
 from celery.app import task
 from dataproc.exceptions import ProcessorDatasetExists
@@ -70,6 +71,11 @@ class Processor(BaseProcessorABC):
     """A Processor for WRI Aqueduct"""
 
     total_expected_files = 379
+    # Source folder holds ~379 tiffs with no sidecar files - skip GDAL's directory listing on every open
+    gdal_config_options = {"GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR"}
+    # Outputs are written as Cloud Optimized GeoTIFFs (tiled, with averaged overviews) for downstream tile reads
+    output_format = "COG"
+    output_creation_options = ["COMPRESS=DEFLATE", "BLOCKSIZE=256", "RESAMPLING=AVERAGE"]
     index_filename = "index.html"
     license_filename = "license.html"
 
@@ -79,28 +85,29 @@ class Processor(BaseProcessorABC):
 
     def exists(self):
         """Whether all output files for a given processor & boundary exist on the FS on not"""
-        try:
-            count_on_backend = self.storage_backend.count_boundary_data_files(
-                self.boundary["name"],
-                self.metadata.name,
-                self.metadata.version,
-                datafile_ext=".tif",
-            )
-        except FileNotFoundError:
+        existing_files = self._existing_output_files()
+        if existing_files is None:
             return False
-        return count_on_backend == self.total_expected_files
+        return len(existing_files) == self.total_expected_files
 
     def generate(self):
         """Generate files for a given processor"""
-        if self.exists() is True:
+        # Loop invariants
+        boundary_name = self.boundary["name"]
+        meta_name = self.metadata.name
+        meta_version = self.metadata.version
+        # Single listing of the backend serves both the exists check and the cleanup
+        existing_files = self._existing_output_files()
+        if existing_files is not None and len(existing_files) == self.total_expected_files:
             raise ProcessorDatasetExists()
-        else:
+        if existing_files is not None:
             # Ensure we start with a blank output folder on the storage backend
+            #   (including any non-tif leftovers)
             try:
                 self.storage_backend.remove_boundary_data_files(
-                    self.boundary["name"],
-                    self.metadata.name,
-                    self.metadata.version,
+                    boundary_name,
+                    meta_name,
+                    meta_version,
                 )
             except FileNotFoundError:
                 pass
@@ -125,18 +132,26 @@ class Processor(BaseProcessorABC):
             output_fpath = os.path.join(
                 self.tmp_processing_folder, 
                 output_filename(
-                    self.metadata.name,
-                    self.metadata.version,
-                    self.boundary["name"],
+                    meta_name,
+                    meta_version,
+                    boundary_name,
                     'tif',
                     dataset_subfilename=subfilename
                 )
             )
 
-            assert_geotiff(geotiff_fpath)
-            crop_success = crop_raster(geotiff_fpath, output_fpath, self.boundary)
+            # Source validation is fused with the crop to avoid opening each tiff twice
+            crop_success = crop_raster(
+                geotiff_fpath,
+                output_fpath,
+                self.boundary,
+                creation_options=self.output_creation_options,
+                assert_valid=True,
+                gdal_config_options=self.gdal_config_options,
+                output_format=self.output_format,
+            )
             self.log.debug(
-                "%s crop %s - success: %s", self.metadata.name, fileinfo.name, crop_success
+                "%s crop %s - success: %s", meta_name, fileinfo.name, crop_success
             )
             if crop_success:
                 results_fpaths.append(
@@ -151,22 +166,24 @@ class Processor(BaseProcessorABC):
             len(results_fpaths) == self.total_expected_files
         ), f"number of successfully cropped files {len(results_fpaths)} do not match expected {self.total_expected_files}"
 
-        self.log.debug("%s - moving cropped data to backend", self.metadata.name)
+        self.log.debug("%s - moving cropped data to backend", meta_name)
         self.update_progress(85, "moving result")
         result_uris = []
         for result in results_fpaths:
+            # Hash and size are already collected, so the local crop is no longer required
             result_uri = self.storage_backend.put_processor_data(
                 result["fpath"],
-                self.boundary["name"],
-                self.metadata.name,
-                self.metadata.version,
+                boundary_name,
+                meta_name,
+                meta_version,
+                remove_local_source=True,
             )
             result_uris.append(result_uri)
 
-        self.provenance_log[f"{self.metadata.name} - move to storage success"] = (
+        self.provenance_log[f"{meta_name} - move to storage success"] = (
             len(result_uris) == self.total_expected_files
         )
-        self.provenance_log[f"{self.metadata.name} - result URIs"] = ",".join(result_uris)
+        self.provenance_log[f"{meta_name} - result URIs"] = ",".join(result_uris)
 
         # Generate documentation on backend
         self.update_progress(90, "generate documentation & datapackage")
@@ -181,7 +198,7 @@ class Processor(BaseProcessorABC):
             [i["hash"] for i in results_fpaths],
         )
         self.provenance_log["datapackage"] = datapkg
-        self.log.debug("%s generated datapackage in log: %s", self.metadata.name, datapkg)
+        self.log.debug("%s generated datapackage in log: %s", meta_name, datapkg)
 
         return self.provenance_log
 
@@ -215,12 +232,26 @@ class Processor(BaseProcessorABC):
         ] = license_create
         self.log.debug("%s generated documentation on backend", self.metadata.name)
 
+    def _existing_output_files(self) -> List[str]:
+        """
+        Filenames of output tiffs already on the storage backend for this boundary
+
+        ::returns existing_files List[str] or None if the output folder does not exist
+        """
+        try:
+            return self.storage_backend.list_boundary_data_files(
+                self.boundary["name"],
+                self.metadata.name,
+                self.metadata.version,
+                datafile_ext=".tif",
+            )
+        except FileNotFoundError:
+            return None
+
     def _fetch_source(self):
         """
         Fetch and unpack the required source data if required.
         """
-        # Build Source Path
-        os.makedirs(self.source_folder, exist_ok=True)
         if self._all_source_exists():
             self.log.debug(
                 "%s - all source files appear to exist and are valid", self.metadata.name
@@ -45,12 +45,39 @@ class BaseProcessorABC(ABC):
         self.paths_helper = self.setup_paths_helper(processing_root_folder)
         self.provenance_log = {}
         self.log = logging.getLogger(__name__)
+        # Processing folders are created lazily on first access,
+        # so processors which only check exists() touch no folders
+        self._created_folders = set()
         # Source folder will persist between processor runs
         self.source_folder = self.paths_helper.build_absolute_path("source_data")
-        os.makedirs(self.source_folder, exist_ok=True)
         # Tmp Processing data will be cleaned between processor runs
         self.tmp_processing_folder = self.paths_helper.build_absolute_path("tmp", self.boundary['name'])
-        os.makedirs(self.tmp_processing_folder, exist_ok=True)
+
+    @property
+    def source_folder(self) -> str:
+        """Source data folder (created on first access)"""
+        return self._ensure_folder(self._source_folder)
+
+    @source_folder.setter
+    def source_folder(self, folder_path: str):
+        self._source_folder = folder_path
+
+    @property
+    def tmp_processing_folder(self) -> str:
+        """Tmp processing folder (created on first access)"""
+        return self._ensure_folder(self._tmp_processing_folder)
+
+    @tmp_processing_folder.setter
+    def tmp_processing_folder(self, folder_path: str):
+        self._tmp_processing_folder = folder_path
+
+    def _ensure_folder(self, folder_path: str) -> str:
+        """Create the given folder if it has not already been created by this processor"""
+        if folder_path not in self._created_folders:
+            if not os.path.isdir(folder_path):
+                os.makedirs(folder_path, exist_ok=True)
+            self._created_folders.add(folder_path)
+        return folder_path
 
     def __enter__(self):
         return self
@@ -63,10 +90,31 @@ class BaseProcessorABC(ABC):
             exc_val,
             exc_tb,
         )
+        self._remove_tmp_processing_folder()
+
+    def _remove_tmp_processing_folder(self):
+        """
+        Remove the tmp processing folder
+
+        Unlinks files directly and only falls back to rmtree for nested folders
+        """
         try:
-            shutil.rmtree(self.tmp_processing_folder, ignore_errors=True)
+            with os.scandir(self._tmp_processing_folder) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        os.unlink(entry.path)
+            os.rmdir(self._tmp_processing_folder)
         except FileNotFoundError:
             pass
+        except OSError as err:
+            self.log.warning(
+                "failed to remove tmp processing folder %s due to %s",
+                self._tmp_processing_folder,
+                err,
+            )
+        self._created_folders.discard(self._tmp_processing_folder)
 
     def update_progress(
         self,
@@ -5,8 +5,13 @@ import json
 import os
 import logging
 
-from dataproc.backends.base import PathsHelper
-from config import LOCALFS_PROCESSING_BACKEND_ROOT
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Static boundary documentation and datapackage templates
+TEMPLATES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
 
 
 class BoundaryProcessor:
@@ -29,13 +34,8 @@ class BoundaryProcessor:
         """
         self.boundary = boundary
         self.storage_backend = storage_backend
-        self.paths_helper = PathsHelper(LOCALFS_PROCESSING_BACKEND_ROOT)
         self.log = logging.getLogger(__name__)
         self.provenance_log = {}
-        self.tmp_processing_folder = self.paths_helper.build_absolute_path(
-            "boundary_processor", self.boundary["name"], "tmp"
-        )
-        os.makedirs(self.tmp_processing_folder, exist_ok=True)
 
     def generate(self) -> dict:
         """Generate files for a given processor"""
@@ -58,122 +58,93 @@ class BoundaryProcessor:
         else:
             self.log.debug("Boundary data folder for %s exists", self.boundary["name"])
         # Generate missing files for the boundary
-        if not self.storage_backend.boundary_file_exists(
-            self.boundary["name"], self.index_filename
-        ):
-            # Create the index
-            index_fpath = self._generate_index_file()
-            index_create = self.storage_backend.put_boundary_data(
-                index_fpath, self.boundary["name"]
-            )
-            self.log.debug(
-                "Boundary index for %s created: %s", self.boundary["name"], index_create
-            )
-            self.provenance_log["boundary_index"] = "created"
+        boundary_files = {
+            self.index_filename: ("index", self._generate_index_file),
+            self.license_filename: ("license", self._generate_license_file),
+            self.version_filename: ("version", self._generate_version_file),
+        }
+        # Single check against the backend for all files (none exist in a newly created boundary folder)
+        if self.provenance_log["boundary_folder"] == "created":
+            files_exist = {
+                filename: False
+                for filename in list(boundary_files.keys()) + [self.datapackage_filename]
+            }
         else:
-            self.log.debug("Boundary index for %s exists", self.boundary["name"])
-        if not self.storage_backend.boundary_file_exists(
-            self.boundary["name"], self.license_filename
-        ):
-            license_fpath = self._generate_license_file()
-            license_create = self.storage_backend.put_boundary_data(
-                license_fpath, self.boundary["name"]
-            )
-            self.log.debug(
-                "Boundary license for %s created: %s",
+            files_exist = self.storage_backend.boundary_files_exist(
                 self.boundary["name"],
-                license_create,
+                list(boundary_files.keys()) + [self.datapackage_filename],
             )
-            self.provenance_log["boundary_license"] = "created"
-        else:
-            self.log.debug("Boundary license for %s exists", self.boundary["name"])
-        if not self.storage_backend.boundary_file_exists(
-            self.boundary["name"], self.version_filename
-        ):
-            version_fpath = self._generate_version_file()
-            version_create = self.storage_backend.put_boundary_data(
-                version_fpath, self.boundary["name"]
+        generated_fpaths = []
+        generated_labels = []
+        for filename, (file_label, generate_file) in boundary_files.items():
+            if files_exist[filename]:
+                self.log.debug(
+                    "Boundary %s for %s exists", file_label, self.boundary["name"]
+                )
+                continue
+            generated_fpaths.append(generate_file())
+            generated_labels.append(file_label)
+        # Push all generated files to the backend in one batch
+        if generated_fpaths:
+            self.storage_backend.put_boundary_data_bulk(
+                generated_fpaths, self.boundary["name"]
             )
+        for file_label in generated_labels:
             self.log.debug(
-                "Boundary version for %s created: %s",
-                self.boundary["name"],
-                version_create,
+                "Boundary %s for %s created: True", file_label, self.boundary["name"]
             )
-            self.provenance_log["boundary_version"] = "created"
+            self.provenance_log[f"boundary_{file_label}"] = "created"
+        # The datapackage is rendered per-boundary and written directly to the backend
+        if files_exist[self.datapackage_filename]:
+            self.log.debug("Boundary datapackage for %s exists", self.boundary["name"])
         else:
-            self.log.debug("Boundary version for %s exists", self.boundary["name"])
-        if not self.storage_backend.boundary_file_exists(
-            self.boundary["name"], self.datapackage_filename
-        ):
-            datapkg_fpath = self._generate_datapackage_file()
-            datapkg_create = self.storage_backend.put_boundary_data(
-                datapkg_fpath, self.boundary["name"]
+            self.storage_backend.put_boundary_data_bytes(
+                self.boundary["name"],
+                self.datapackage_filename,
+                self._generate_datapackage(),
             )
             self.log.debug(
-                "Boundary datapackage for %s created: %s",
-                self.boundary["name"],
-                datapkg_create,
+                "Boundary datapackage for %s created: True", self.boundary["name"]
             )
             self.provenance_log["boundary_datapackage"] = "created"
-        else:
-            self.log.debug("Boundary datapackage for %s exists", self.boundary["name"])
         return {"boundary_processor": self.provenance_log}
 
     def _generate_index_file(self) -> str:
         """
         Generate the index documentation file for a boundary
 
-        ::returns dest_fpath str Destination filepath on the processing backend
+        ::returns template_fpath str Static template filepath
         """
-        template_fpath = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), "templates", self.index_filename
-        )
-        return template_fpath
+        return os.path.join(TEMPLATES_FOLDER, self.index_filename)
 
     def _generate_license_file(self) -> str:
         """
         Generate the License documentation file for a boundary
 
-        ::returns dest_fpath str Destination filepath on the processing backend
+        ::returns template_fpath str Static template filepath
         """
-        template_fpath = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            "templates",
-            self.license_filename,
-        )
-        return template_fpath
+        return os.path.join(TEMPLATES_FOLDER, self.license_filename)
 
     def _generate_version_file(self) -> str:
         """
         Generate the Version documentation file for a boundary
 
-        ::returns dest_fpath str Destination filepath on the processing backend
+        ::returns template_fpath str Static template filepath
         """
-        template_fpath = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            "templates",
-            self.version_filename,
-        )
-        return template_fpath
-
-    def _generate_datapackage_file(self) -> str:
+        return os.path.join(TEMPLATES_FOLDER, self.version_filename)
+
+    def _generate_datapackage(self) -> bytes:
         """
-        Generate the Datapackage.json file for a boundary
+        Generate the Datapackage.json content for a boundary
 
-        ::returns dest_fpath str Destination filepath on the processing backend
+        ::returns datapackage bytes Encoded datapackage.json content
         """
-        template_fpath = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            "templates",
-            self.datapackage_filename,
-        )
-        dest_fpath = os.path.join(self.tmp_processing_folder, "datapackage.json")
+        template_fpath = os.path.join(TEMPLATES_FOLDER, self.datapackage_filename)
         with open(template_fpath, "r") as fptr:
             datapkg = json.load(fptr)
         # Insert some content
         datapkg["name"] = self.boundary["name"]
         datapkg["title"] = self.boundary["name"]
-        with open(dest_fpath, "w") as fptr:
-            json.dump(datapkg, fptr)
-            # Return the path
-            return dest_fpath
+        if orjson is not None:
+            return orjson.dumps(datapkg)
+        return json.dumps(datapkg).encode()
@@ -1,8 +1,7 @@
 """
 Manages provenance files for a given boundary
 """
-import os
-from typing import Any, List
+from typing import List
 from datetime import datetime
 import logging
 
@@ -25,16 +24,19 @@ class ProvenanceProcessor:
         """Generate files for a given processor"""
         # Remove duplicate boundary processor entries and extract DataPackage Update Entries
         boundary_log = None
+        processor_logs = []
         datapackage_resources = []
         for log in processing_log:
-            if not boundary_log:
-                boundary_log = {"boundary_processor": log["boundary_processor"]}
-            log.pop("boundary_processor")
+            boundary_processor_log = log.pop("boundary_processor", None)
+            if boundary_log is None and boundary_processor_log is not None:
+                boundary_log = {"boundary_processor": boundary_processor_log}
             # Extract the datapackage from proevnance log
             for processor_name_version, name_version_log in log.items():
                 if "datapackage" in name_version_log.keys():
                     datapackage_resources.append(name_version_log["datapackage"])
-        processing_log.insert(0, boundary_log)
+            processor_logs.append(log)
+        # Boundary entry leads the flattened log
+        processing_log = ([boundary_log] if boundary_log else []) + processor_logs
 
         # Update the datapackage
         self._update_datapackage(datapackage_resources)
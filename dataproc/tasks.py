@@ -1,13 +1,13 @@
 """
 Processor Task Wrappers
 """
-from typing import Any, List
+from typing import Any
 from contextlib import contextmanager
 import logging
 
-from celery import signals, states
+from celery import signals
 from celery.utils.log import get_task_logger
-from redis import Redis
+from redis import ConnectionPool, Redis
 
 from config import (
     LOG_LEVEL,
@@ -23,14 +23,16 @@ from dataproc.processors.internal import (
     BoundaryProcessor,
     ProvenanceProcessor,
 )
-from dataproc.exceptions import ProcessorAlreadyExecutingException, ProcessorDatasetExists, ProcessorExecutionFailed
+from dataproc.exceptions import ProcessorAlreadyExecutingException, ProcessorDatasetExists
 from dataproc.backends.storage import init_storage_backend
 
 # Setup Configured Storage Backend
 storage_backend = init_storage_backend(STORAGE_BACKEND)
 
 # Used for guarding against parallel execution of duplicate tasks
-redis_client = Redis(host=REDIS_HOST)
+#   Connections are pooled and reused across tasks within a worker process
+redis_pool = ConnectionPool(host=REDIS_HOST, max_connections=32)
+redis_client = Redis(connection_pool=redis_pool)
 
 def task_sig_exists(task_sig) -> bool:
     """Check a task signature in Redis"""
@@ -40,10 +42,13 @@ def task_sig_exists(task_sig) -> bool:
 def redis_lock(task_sig: str):
     """
     Manage Task execution lock within redis
+
+    Acquired atomically (SET NX EX) in a single round-trip
     """
-    if task_sig_exists(task_sig) is True:
+    acquired = redis_client.set(task_sig, "", ex=TASK_LOCK_TIMEOUT, nx=True)
+    if not acquired:
         raise ProcessorAlreadyExecutingException()
-    yield redis_client.setex(task_sig, TASK_LOCK_TIMEOUT, value="")
+    yield acquired
 
 
 def task_signature(boundary_name: str, processor: str):
@@ -93,7 +98,7 @@ def boundary_setup(boundary: Boundary) -> dict:
                     # Update sink for this processor
                     return {"boundary_processor": {"failed": type(err).__name__}}
                 finally:
-                    _ = redis_client.getdel(task_sig)
+                    _ = redis_client.delete(task_sig)
             else:
                 raise ProcessorAlreadyExecutingException()
     except ProcessorAlreadyExecutingException:
@@ -160,7 +165,7 @@ def processor_task(
                     sink[processor_name_version] = {"failed": f"{type(err).__name__} - {err}"}
                     return sink
                 finally:
-                    _ = redis_client.getdel(task_sig)
+                    _ = redis_client.delete(task_sig)
             else:
                 raise ProcessorAlreadyExecutingException()
     except ProcessorAlreadyExecutingException:
@@ -199,7 +204,7 @@ def generate_provenance(self, sink: Any, boundary: Boundary):
                     else:
                         sink.append({"generate_provenance failed": type(err).__name__})
                 finally:
-                    _ = redis_client.getdel(task_sig)
+                    _ = redis_client.delete(task_sig)
             else:
                 raise ProcessorAlreadyExecutingException()
     except ProcessorAlreadyExecutingException as err:
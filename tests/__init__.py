@@ -1,2 +1,6 @@
+import os
 import logging
-logging.disable(logging.ERROR)
\ No newline at end of file
+logging.disable(logging.ERROR)
+
+# Root of the tests tree, resolved once for all test modules
+TESTS_ROOT = os.path.dirname(os.path.abspath(__file__))
\ No newline at end of file
@@ -4,15 +4,15 @@ Tests for Boundaries
 
 import os
 import sys
-import inspect
 import unittest
 
 import requests
 
-current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+current_dir = os.path.dirname(os.path.abspath(__file__))
 api_tests_dir = os.path.dirname(current_dir)
 tests_data_dir = os.path.join(os.path.dirname(api_tests_dir), "data")
-sys.path.insert(0, api_tests_dir)
+if api_tests_dir not in sys.path:
+    sys.path.insert(0, api_tests_dir)
 
 from api.routes import BOUNDARIES_BASE_ROUTE, BOUNDARY_ROUTE, BOUNDARY_SEARCH_ROUTE
 from tests.helpers import wipe_db, build_route
@@ -26,6 +26,14 @@ class TestBoundaries(unittest.TestCase):
 
     """"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.session = requests.Session()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
     def setUp(self) -> None:
         # Wipe the DB
         wipe_db()
@@ -74,7 +82,7 @@ class TestBoundaries(unittest.TestCase):
         Retrieve all boundary summary info
         """
         route = build_route(BOUNDARIES_BASE_ROUTE)
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_boundary_summary(response, expected_count=TOTAL_BOUNDARIES)
 
     def test_get_boundary_by_name(self):
@@ -83,7 +91,7 @@ class TestBoundaries(unittest.TestCase):
         """
         expected_name = "ssudan"
         route = build_route(BOUNDARY_ROUTE.format(name=expected_name))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_boundary_detail(response)
         self.assertEqual(response.json()["name"], expected_name)
 
@@ -93,7 +101,7 @@ class TestBoundaries(unittest.TestCase):
         """
         expected_name = "lkjhasdklfj"
         route = build_route(BOUNDARY_ROUTE.format(name=expected_name))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, 404)
 
     def test_search_boundary_by_name(self):
@@ -103,7 +111,7 @@ class TestBoundaries(unittest.TestCase):
         search_name = 'mbi'
         expected_names = ['mozambique', 'gambia', 'zambia']
         route = build_route(f"{BOUNDARY_SEARCH_ROUTE}?name={search_name}")
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_boundary_summary(response, expected_count=len(expected_names))
         self.assertCountEqual(
             [item["name"] for item in response.json()], expected_names)
@@ -115,7 +123,7 @@ class TestBoundaries(unittest.TestCase):
         search_name = 'kjhasdlfkhjasdf'
         expected_names = []
         route = build_route(f"{BOUNDARY_SEARCH_ROUTE}?name={search_name}")
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_boundary_summary(response, expected_count=len(expected_names))
         self.assertCountEqual(
             [item["name"] for item in response.json()], expected_names)
@@ -125,7 +133,7 @@ class TestBoundaries(unittest.TestCase):
         search_longitude = 3.2
         expected_names = ['algeria']
         route = build_route(f"{BOUNDARY_SEARCH_ROUTE}?latitude={search_latitude}&longitude={search_longitude}")
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_boundary_summary(response, expected_count=len(expected_names))
         self.assertCountEqual(
             [item["name"] for item in response.json()], expected_names)
@@ -135,7 +143,7 @@ class TestBoundaries(unittest.TestCase):
         search_longitude = 0.0
         expected_names = ['algeria']
         route = build_route(f"{BOUNDARY_SEARCH_ROUTE}?latitude={search_latitude}&longitude={search_longitude}")
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_boundary_summary(response, expected_count=len(expected_names))
         self.assertCountEqual(
             [item["name"] for item in response.json()], expected_names)
@@ -145,7 +153,7 @@ class TestBoundaries(unittest.TestCase):
         search_longitude = 113.2
         expected_names = []
         route = build_route(f"{BOUNDARY_SEARCH_ROUTE}?latitude={search_latitude}&longitude={search_longitude}")
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_boundary_summary(response, expected_count=len(expected_names))
         self.assertCountEqual(
             [item["name"] for item in response.json()], expected_names)
@@ -4,21 +4,21 @@ Tests for Processing Jobs
 
 import os
 import sys
-import inspect
 import unittest
 from uuid import uuid4
-from time import time, sleep
+from time import sleep
 import json
 import shutil
 
 import requests
 
-current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 from api.routes import JOB_STATUS_ROUTE, JOBS_BASE_ROUTE
-from tests.helpers import build_route, remove_tree, assert_package
+from tests.helpers import build_route, remove_tree, assert_package, wait_for_jobs
 from tests.dataproc.integration.processors import (
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
 )
@@ -90,6 +90,8 @@ class TestProcessingJobs(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.max_job_await = 20  # secs
+        # Single keep-alive HTTP session for all requests in the suite
+        cls.session = requests.Session()
         cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
         clean_packages(
             STORAGE_BACKEND,
@@ -101,6 +103,7 @@ class TestProcessingJobs(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        cls.session.close()
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -126,7 +129,7 @@ class TestProcessingJobs(unittest.TestCase):
         expected_status = "PENDING"
         noexist_job = str(uuid4())
         route = build_route(JOB_STATUS_ROUTE.format(job_id=noexist_job))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, expected_code)
         self.assertEqual(response.json()["job_group_status"], expected_status)
 
@@ -134,7 +137,7 @@ class TestProcessingJobs(unittest.TestCase):
         """Submission of a job against a boundary that doesnt exist"""
         expected_code = 400
         route = build_route(JOBS_BASE_ROUTE)
-        response = requests.post(route, json=JOB_SUBMIT_DATA_BOUNDARY_NOEXIST)
+        response = self.session.post(route, json=JOB_SUBMIT_DATA_BOUNDARY_NOEXIST)
         self.assertEqual(response.status_code, expected_code)
         self.assertDictEqual(
             response.json(), {"detail": "Requested boundary noexist could not be found"}
@@ -144,7 +147,7 @@ class TestProcessingJobs(unittest.TestCase):
         """Submission of a job against a processor that doesnt exist"""
         expected_code = 400
         route = build_route(JOBS_BASE_ROUTE)
-        response = requests.post(route, json=JOB_SUBMIT_DATA_PROC_NOEXIST)
+        response = self.session.post(route, json=JOB_SUBMIT_DATA_PROC_NOEXIST)
         self.assertEqual(response.status_code, expected_code)
         self.assertDictEqual(
             response.json(),
@@ -157,7 +160,7 @@ class TestProcessingJobs(unittest.TestCase):
         """Submission of a job with duplicate processors in the request"""
         expected_code = 422
         route = build_route(JOBS_BASE_ROUTE)
-        response = requests.post(route, json=JOB_SUBMIT_DATA_PROC_DUP)
+        response = self.session.post(route, json=JOB_SUBMIT_DATA_PROC_DUP)
         self.assertEqual(response.status_code, expected_code)
         self.assertEqual(
             response.json()["detail"][0]["msg"], "duplicate processors not allowed"
@@ -168,27 +171,16 @@ class TestProcessingJobs(unittest.TestCase):
         # Ensure the package tree is clean
         expected_code = 202
         route = build_route(JOBS_BASE_ROUTE)
-        response = requests.post(route, json=JOB_SUBMIT_DATA_GAMBIA_TEST_PROC)
+        response = self.session.post(route, json=JOB_SUBMIT_DATA_GAMBIA_TEST_PROC)
         self.assertEqual(response.status_code, expected_code)
         self.assertIn("job_id", response.json().keys())
         job_id = response.json()["job_id"]
         # Await job completion
-        start = time()
-        while True:
-            route = build_route(JOB_STATUS_ROUTE.format(job_id=job_id))
-            response = requests.get(route)
-            if response.json()["job_group_processors"]:
-                self.assertEqual(
-                    response.json()["job_group_processors"][0]["job_id"], job_id
-                )
-            if not response.json()["job_group_status"] == "PENDING":
-                # Final await for any S3 refreshing backend
-                sleep(1.0)
-                break
-            sleep(1.0)
-            if (time() - start) > self.max_job_await:
-                self.fail("max await reached")
-        self.assertEqual(response.json()["job_group_status"], "COMPLETE")
+        status = wait_for_jobs([job_id], self.max_job_await, session=self.session)[0]
+        # Final await for any S3 refreshing backend
+        sleep(1.0)
+        self.assertEqual(status["job_group_processors"][0]["job_id"], job_id)
+        self.assertEqual(status["job_group_status"], "COMPLETE")
         # Assert the package integrity, including submitted processor
         if STORAGE_BACKEND == "localfs":
             assert_package(
@@ -207,29 +199,18 @@ class TestProcessingJobs(unittest.TestCase):
         # Ensure the package tree is clean
         expected_code = 202
         route = build_route(JOBS_BASE_ROUTE)
-        response = requests.post(route, json=JOB_SUBMIT_DATA_ZIMBABWE_TEST_PROC)
+        response = self.session.post(route, json=JOB_SUBMIT_DATA_ZIMBABWE_TEST_PROC)
         self.assertEqual(response.status_code, expected_code)
         self.assertIn("job_id", response.json().keys())
         job_id = response.json()["job_id"]
         # Await job completion
-        start = time()
-        while True:
-            route = build_route(JOB_STATUS_ROUTE.format(job_id=job_id))
-            response = requests.get(route)
-            if response.json()["job_group_processors"]:
-                self.assertEqual(
-                    response.json()["job_group_processors"][0]["job_id"], job_id
-                )
-            if not response.json()["job_group_status"] == "PENDING":
-                # Final await for any S3 refreshing backend
-                sleep(1.0)
-                break
-            sleep(1.0)
-            if (time() - start) > self.max_job_await:
-                self.fail("max await reached")
-        self.assertEqual(response.json()["job_group_status"], "COMPLETE")
+        status = wait_for_jobs([job_id], self.max_job_await, session=self.session)[0]
+        # Final await for any S3 refreshing backend
+        sleep(1.0)
+        self.assertEqual(status["job_group_processors"][0]["job_id"], job_id)
+        self.assertEqual(status["job_group_status"], "COMPLETE")
         # Job Statuses show failed
-        self.assertEqual(response.json()["job_group_processors"][0]['job_status'], "FAILURE")
+        self.assertEqual(status["job_group_processors"][0]['job_status'], "FAILURE")
 
 
     def test_submit_job_already_executing_using_test_processor(self):
@@ -243,7 +224,7 @@ class TestProcessingJobs(unittest.TestCase):
         route = build_route(JOBS_BASE_ROUTE)
         responses = []
         for _ in range(dup_processors_to_submit):
-            response = requests.post(route, json=JOB_SUBMIT_DATA_ZAMBIA_TEST_PROC)
+            response = self.session.post(route, json=JOB_SUBMIT_DATA_ZAMBIA_TEST_PROC)
             responses.append(response)
         self.assertListEqual(
             [i.status_code for i in responses],
@@ -251,27 +232,10 @@ class TestProcessingJobs(unittest.TestCase):
             expected_responses,
         )
         submitted_ids = [data.json()["job_id"] for data in responses]
-        # Wait for both processors to finish
-        completed = [False for i in expected_responses]
-        statuses = ["NULL" for i in range(dup_processors_to_submit)]
-        results = [{} for i in range(dup_processors_to_submit)]
-        start = time()
-        while not all(completed):
-            for idx, job_id in enumerate(submitted_ids):
-                route = build_route(JOB_STATUS_ROUTE.format(job_id=job_id))
-                response = requests.get(route)
-                completed[idx] = (
-                    True
-                    if response.json()["job_group_status"] == "COMPLETE"
-                    else False
-                )
-                if len(response.json()["job_group_processors"]) > 0:
-                    results[idx] = response.json()["job_group_processors"][0]
-                statuses[idx] = response.json()["job_group_status"]
-                sleep(0.01)
-            if (time() - start) > max_wait:
-                self.fail("max await time exceeded")
-            sleep(0.5)
+        # Wait for all processors to finish
+        job_statuses = wait_for_jobs(submitted_ids, max_wait, session=self.session)
+        statuses = [status["job_group_status"] for status in job_statuses]
+        results = [status["job_group_processors"][0] for status in job_statuses]
         # Jobs completed successfully
         self.assertEqual(statuses, ["COMPLETE" for i in range(dup_processors_to_submit)])
         # Job Statuses show skipped and success
@@ -333,7 +297,7 @@ class TestProcessingJobs(unittest.TestCase):
         route = build_route(JOBS_BASE_ROUTE)
         responses = []
         for _ in range(dup_processors_to_submit):
-            response = requests.post(route, json=JOB_SUBMIT_DATA_SSUDAN_NE_VECTOR_PROC)
+            response = self.session.post(route, json=JOB_SUBMIT_DATA_SSUDAN_NE_VECTOR_PROC)
             responses.append(response)
         self.assertListEqual(
             [i.status_code for i in responses],
@@ -341,27 +305,10 @@ class TestProcessingJobs(unittest.TestCase):
             expected_responses,
         )
         submitted_ids = [data.json()["job_id"] for data in responses]
-        # Wait for both processors to finish
-        completed = [False for i in expected_responses]
-        statuses = ["NULL" for i in range(dup_processors_to_submit)]
-        results = [{} for i in range(dup_processors_to_submit)]
-        start = time()
-        while not all(completed):
-            if (time() - start) > max_wait:
-                self.fail("max await reached")
-            for idx, job_id in enumerate(submitted_ids):
-                route = build_route(JOB_STATUS_ROUTE.format(job_id=job_id))
-                response = requests.get(route)
-                completed[idx] = (
-                    True
-                    if response.json()["job_group_status"] == "COMPLETE"
-                    else False
-                )
-                if len(response.json()["job_group_processors"]) > 0:
-                    results[idx] = response.json()["job_group_processors"][0]
-                statuses[idx] = response.json()["job_group_status"]
-                sleep(0.01)
-            sleep(0.5)
+        # Wait for all processors to finish
+        job_statuses = wait_for_jobs(submitted_ids, max_wait, session=self.session)
+        statuses = [status["job_group_status"] for status in job_statuses]
+        results = [status["job_group_processors"][0] for status in job_statuses]
         # Jobs completed successfully
         self.assertEqual(statuses, ["COMPLETE" for i in range(dup_processors_to_submit)])
         # Job Statuses show skipped and success
@@ -4,15 +4,15 @@ Tests for Packages
 
 import os
 import sys
-import inspect
 import unittest
 import shutil
 
 import requests
 
-current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 from api.routes import PACKAGE_ROUTE, PACKAGES_BASE_ROUTE
 from tests.helpers import (
@@ -44,9 +44,11 @@ class TestPackages(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.backend = init_storage_backend(STORAGE_BACKEND)
+        cls.session = requests.Session()
 
     @classmethod
     def tearDownClass(cls):
+        cls.session.close()
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -95,7 +97,7 @@ class TestPackages(unittest.TestCase):
                     S3_BUCKET,
                 )
         route = build_route(PACKAGES_BASE_ROUTE)
-        response = requests.get(route)
+        response = self.session.get(route)
         # Ensure we can find at least the fake packages we created
         self.assertIn(
             "zambia", [boundary["boundary_name"] for boundary in response.json()]
@@ -108,7 +110,7 @@ class TestPackages(unittest.TestCase):
     def test_get_package_by_name_not_found(self):
         """Attempt to retrieve details of a package which does not exist"""
         route = build_route(PACKAGE_ROUTE.format(boundary_name="noexist"))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, 404)
         self.assertDictEqual(response.json(), {"detail": "Package noexist not found"})
 
@@ -129,7 +131,7 @@ class TestPackages(unittest.TestCase):
                     s3_fs, S3_BUCKET, packages=["gambia"], datasets=["noexist"]
                 )
         route = build_route(PACKAGE_ROUTE.format(boundary_name="gambia"))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, 404)
         self.assertDictEqual(
             response.json(),
@@ -160,6 +162,6 @@ class TestPackages(unittest.TestCase):
                     datasets=["natural_earth_raster"],
                 )
         route = build_route(PACKAGE_ROUTE.format(boundary_name="gambia"))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assert_package(response, "gambia", ["natural_earth_raster.version_1"])
         remove_tree(LOCAL_FS_PACKAGE_DATA_TOP_DIR, packages=["gambia"])
@@ -4,14 +4,14 @@ Tests for Probes
 
 import os
 import sys
-import inspect
 import unittest
 
 import requests
 
-current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 from api.routes import LIVENESS_ROUTE, READINESS_ROUTE
 from config import INTEGRATION_TEST_ENDPOINT
@@ -24,6 +24,14 @@ class TestProbes(unittest.TestCase):
     These tests require API and Celery Worker to be run ning (with redis)
     """
 
+    @classmethod
+    def setUpClass(cls):
+        cls.session = requests.Session()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+
     def build_probes_route(self, probe_type):
         if probe_type == 'liveness':
             _route = LIVENESS_ROUTE
@@ -34,11 +42,11 @@ class TestProbes(unittest.TestCase):
     def test_liveness(self):
         expected_code = 200
         route = self.build_probes_route("liveness")
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, expected_code)
 
     def test_readinessness(self):
         expected_code = 200
         route = self.build_probes_route("readiness")
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, expected_code)
@@ -4,14 +4,14 @@ Tests for Processor Endpoints
 
 import os
 import sys
-import inspect
 import unittest
 
 import requests
 
-current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 from api.routes import (
     PROCESSORS_BASE_ROUTE,
@@ -47,18 +47,18 @@ class TestProcessors(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        pass
+        cls.session = requests.Session()
 
     @classmethod
     def tearDownClass(cls):
-        pass
+        cls.session.close()
 
     def test_get_all_processors(self):
         """
         Retrieve all Processors
         """
         route = build_route(PROCESSORS_BASE_ROUTE)
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, 200)
         self.assertTrue(len(response.json()) > 0)
         self.assertIn("test_processor", [proc['name'] for proc in response.json()])
@@ -68,7 +68,7 @@ class TestProcessors(unittest.TestCase):
         Retrieve a processor by name which does not exist
         """
         route = build_route(PROCESSORS_NAME_ROUTE.format(name="noexist"))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, 404)
 
     def test_get_processor_name_version_noexist(self):
@@ -78,7 +78,7 @@ class TestProcessors(unittest.TestCase):
         route = build_route(
             PROCESSORS_VERSION_ROUTE.format(name="test_processor", version="noexist")
         )
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, 404)
 
     def test_get_processor_by_name(self):
@@ -86,7 +86,7 @@ class TestProcessors(unittest.TestCase):
         Retrieve a processor by name
         """
         route = build_route(PROCESSORS_NAME_ROUTE.format(name="test_processor"))
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["name"], "test_processor")
         self.assertEqual(len(response.json()["versions"]), 1)
@@ -101,5 +101,5 @@ class TestProcessors(unittest.TestCase):
                 name="test_processor", version=EXPECTED_PROCESSOR_VERSION["version"]
             )
         )
-        response = requests.get(route)
+        response = self.session.get(route)
         self.assertDictEqual(response.json(), EXPECTED_PROCESSOR_VERSION)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the Boundaries GeoJSON loader
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tests import TESTS_ROOT
+from tests.data import load_boundaries
+
+TEST_BOUNDARIES_FPATH = os.path.join(TESTS_ROOT, "data", "africa_europe.geojson")
+TOTAL_BOUNDARIES = 90
+
+
+def small_feature_collection(crs_name: str) -> dict:
+    """Two-feature FeatureCollection (one Polygon, one MultiPolygon) in the given CRS"""
+    ring = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+    return {
+        "type": "FeatureCollection",
+        "crs": {"type": "name", "properties": {"name": crs_name}},
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"name": "Test Land", "name_long": "Test Land"},
+                "geometry": {"type": "Polygon", "coordinates": [ring]},
+            },
+            {
+                "type": "Feature",
+                "properties": {"name": "Other Land", "name_long": "Other Land"},
+                "geometry": {"type": "MultiPolygon", "coordinates": [[ring]]},
+            },
+        ],
+    }
+
+
+class TestLoadBoundariesJSON(unittest.TestCase):
+    """"""
+
+    def assert_loaded_features(self):
+        """Parse the test boundaries and check all features are returned with clean names"""
+        features = list(load_boundaries.load_boundaries_json(TEST_BOUNDARIES_FPATH))
+        self.assertEqual(len(features), TOTAL_BOUNDARIES)
+        names = [feature["properties"]["name"] for feature in features]
+        self.assertIn("ethiopia", names)
+        self.assertIn("ssudan", names)
+
+    def test_load_boundaries_json_without_ijson(self):
+        """Whole-file parse path (orjson where installed)"""
+        with patch.object(load_boundaries, "ijson", None):
+            self.assert_loaded_features()
+
+    def test_load_boundaries_json_stdlib_only(self):
+        """Whole-file parse path with neither ijson nor orjson"""
+        with patch.object(load_boundaries, "ijson", None), patch.object(
+            load_boundaries, "orjson", None
+        ):
+            self.assert_loaded_features()
+
+    def test_load_boundaries_json_rejects_crs(self):
+        """Boundaries in an unexpected CRS are refused on every parse path"""
+        with patch.object(load_boundaries, "ijson", None):
+            with self.assertRaises(Exception):
+                load_boundaries.load_boundaries_json(
+                    TEST_BOUNDARIES_FPATH, accepted_crs=["EPSG:3857"]
+                )
+
+    def test_copy_text(self):
+        """Values are escaped for the COPY text format and None is written as NULL"""
+        self.assertEqual(load_boundaries.copy_text(None), "\\N")
+        self.assertEqual(load_boundaries.copy_text("a\tb\\c\nd"), "a\\tb\\\\c\\nd")
+
+    def write_small_geojson(self, tmp_dir: str, crs_name: str) -> str:
+        """Write the small test FeatureCollection to file, returning its path"""
+        fpath = os.path.join(tmp_dir, "boundaries.geojson")
+        with open(fpath, "w") as fptr:
+            json.dump(small_feature_collection(crs_name), fptr)
+        return fpath
+
+    def test_load_boundaries_json_streamed(self):
+        """Default ijson streaming path yields every feature with a clean name"""
+        self.assertIsNotNone(load_boundaries.ijson)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fpath = self.write_small_geojson(tmp_dir, "EPSG:4326")
+            features = list(load_boundaries.load_boundaries_json(fpath))
+        self.assertEqual(
+            [feature["properties"]["name"] for feature in features],
+            ["testland", "otherland"],
+        )
+        self.assertEqual(features[1]["geometry"]["type"], "MultiPolygon")
+
+    def test_load_boundaries_json_streamed_rejects_crs(self):
+        """Streamed CRS header is checked before any features are returned"""
+        self.assertIsNotNone(load_boundaries.ijson)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fpath = self.write_small_geojson(tmp_dir, "EPSG:3857")
+            with self.assertRaises(Exception):
+                load_boundaries.load_boundaries_json(fpath)
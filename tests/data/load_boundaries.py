@@ -3,60 +3,148 @@ Clean and load Boundaries GEOJSON
 """
 
 import sys
+import io
 import json
-import string
+import re
 import os
-import inspect
 import asyncio
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
 
 import sqlalchemy as sa
-from sqlalchemy.orm import sessionmaker
+import shapely
+from shapely.geometry import MultiPolygon, shape
 
-current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(os.path.dirname(current_dir))
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 from config import get_db_uri_sync, API_POSTGRES_DB
 from api.db.models import Boundary
 from api import db
 
 
+# Matches every char outside a-z (including non-ASCII)
+CLEAN_NAME_INVALID_CHARS = re.compile(r"[^a-z]")
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> sa.engine.Engine:
+    """
+    Engine shared by all boundary loads in this process
+    """
+    return sa.create_engine(get_db_uri_sync(API_POSTGRES_DB), pool_pre_ping=True)
+
+
 def clean_name(name: str) -> str:
     """
     Remove unwanted chars from a name
     """
     name = name.replace(" ", "-")
     name = name.lower()
-    valid_chars = list(string.ascii_lowercase)
-    return "".join(x for x in name if x in valid_chars)
+    return CLEAN_NAME_INVALID_CHARS.sub("", name)
+
+
+def copy_text(value: Optional[str]) -> str:
+    """
+    Escape a value for the PostgreSQL COPY text format (None is written as NULL)
+    """
+    if value is None:
+        return "\\N"
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def to_multipolygon(geometry: dict) -> MultiPolygon:
+    """
+    Convert a GeoJSON (Multi)Polygon geometry to a MultiPolygon
+    """
+    geom = shape(geometry)
+    if geom.geom_type == "Polygon":
+        geom = MultiPolygon([geom])
+    return geom
+
+
+def multipolygons_hex_ewkb(geoms: List[MultiPolygon], srid: int = 4326) -> List[str]:
+    """
+    Serialise geometries to hex EWKB in a single vectorised shapely call
+    """
+    if not geoms:
+        return []
+    return shapely.to_wkb(
+        shapely.set_srid(geoms, srid), hex=True, include_srid=True
+    ).tolist()
+
+
+def stream_geojson_features(boundaries_geojson_fpath: str) -> Iterator[dict]:
+    """
+    Incrementally parse the features of a GeoJSON FeatureCollection
+    """
+    with open(boundaries_geojson_fpath, "rb") as fptr:
+        for feature in ijson.items(fptr, "features.item", use_float=True):
+            yield feature
+
+
+def clean_features(
+    features: Iterator[dict], name_column="name", skip_names=['-99']
+) -> Iterator[dict]:
+    """
+    Ensure all features have clean names
+    """
+    for feature in features:
+        if name_column not in feature["properties"].keys():
+            raise Exception(
+                f"Boundary Feature GeoJSON properties must contain unique name field, {feature} does not"
+            )
+        if feature["properties"][name_column] not in skip_names:
+            feature["properties"][name_column] = clean_name(
+                feature["properties"][name_column]
+            )
+        yield feature
 
 
 def load_boundaries_json(
     boundaries_geojson_fpath: str, accepted_crs=["EPSG:4326"], name_column="name", skip_names=['-99']
-) -> dict:
+) -> Iterator[dict]:
     """
-    Load Boundaries Geojson to PostGIS
+    Load Boundaries Geojson features (with cleaned names) for loading to PostGIS
+
+    Features are streamed from file when ijson is installed,
+        otherwise the whole collection is parsed up front (using orjson where available)
     """
-    with open(boundaries_geojson_fpath, "r") as fptr:
-        data = json.load(fptr)
+    if ijson is not None:
+        with open(boundaries_geojson_fpath, "rb") as fptr:
+            crs_name = next(ijson.items(fptr, "crs.properties.name"), None)
+        features = stream_geojson_features(boundaries_geojson_fpath)
+    else:
+        if orjson is not None:
+            with open(boundaries_geojson_fpath, "rb") as fptr:
+                data = orjson.loads(fptr.read())
+        else:
+            with open(boundaries_geojson_fpath, "r") as fptr:
+                data = json.load(fptr)
+        crs_name = data["crs"]["properties"]["name"]
+        features = iter(data["features"])
     # Check EPSG
-    if not data["crs"]["properties"]["name"] in accepted_crs:
+    if not crs_name in accepted_crs:
         raise Exception(
             f"Boundary Features must be one of the following CRS's: {accepted_crs}"
         )
-    # Ensure all features have clean names
-    for feature in data["features"]:
-        if name_column not in feature["properties"].keys():
-            raise Exception(
-                f"Boundary Feature GeoJSON properties must contain unique name field, {feature} does not"
-            )
-        if feature["properties"][name_column] in skip_names:
-            continue
-        feature["properties"][name_column] = clean_name(
-            feature["properties"][name_column]
-        )
-    return data
+    return clean_features(features, name_column=name_column, skip_names=skip_names)
 
 
 def load_boundaries(
@@ -72,48 +160,68 @@ def load_boundaries(
     Load a geojson file of multipolygons into Boundaries table
     Internally converts Polygons to Multi
     """
-    data = load_boundaries_json(boundaries_geojson_fpath, name_column=name_column)
-    db_uri = get_db_uri_sync(API_POSTGRES_DB)
+    features = load_boundaries_json(boundaries_geojson_fpath, name_column=name_column)
+    # Build COPY rows as features are parsed (before touching the DB, so invalid input raises and leaves it untouched)
+    #   geometries are converted to MultiPolygon EWKB client-side, serialised as a batch
+    copy_rows = []
+    geoms = []
+    skipped = 0
+    total_features = 0
+    for feature in features:
+        total_features+=1
+        if feature["properties"][name_column] in skip_names:
+            print ('skipped boundary:', feature["properties"][name_column])
+            skipped+=1
+            continue
+        copy_rows.append(
+            "\t".join(
+                [
+                    copy_text(feature["properties"][name_column]),
+                    copy_text(feature["properties"][long_name_column]),
+                    copy_text(admin_level),
+                ]
+            )
+        )
+        geoms.append(to_multipolygon(feature["geometry"]))
+    copy_buffer = io.StringIO()
+    for copy_row, ewkb in zip(copy_rows, multipolygons_hex_ewkb(geoms)):
+        copy_buffer.write(f"{copy_row}\t{ewkb}\n")
+    copy_buffer.seek(0)
     # Init DB and Load via SA
-    engine = sa.create_engine(db_uri, pool_pre_ping=True)
+    engine = get_engine()
     if setup_tables is True:
         db.Base.metadata.create_all(engine)
-    if wipe_table is True:
-        for tbl in reversed(db.Base.metadata.sorted_tables):
-            engine.execute(tbl.delete())
-    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     loaded_ids = []
-    skipped = 0
-    with Session() as session:
-        try:
-            for feature in data["features"]:
-                if feature["properties"][name_column] in skip_names:
-                    print ('skipped boundary:', feature["properties"][name_column])
-                    skipped+=1
-                    continue
-                boundary = Boundary(
-                    name=feature["properties"][name_column],
-                    name_long=feature["properties"][long_name_column],
-                    admin_level=admin_level,
-                    geometry=sa.func.ST_AsEWKT(
-                        sa.func.ST_SetSRID(
-                            sa.func.ST_Multi(
-                                sa.func.ST_GeomFromGeoJSON(
-                                    json.dumps(feature["geometry"])
-                                )
-                            ),
-                            4326,
-                        )
-                    ),
-                )
-                session.add(boundary)
-                _id = session.commit()
-                loaded_ids.append(_id)
-        except Exception as err:
-            print(f"Boundary insert failed due to {err}, rolling back transaction...")
-            session.rollback()
-    engine.dispose()
-    success = len(loaded_ids) == (len(data["features"])-skipped)
+    conn = engine.raw_connection()
+    try:
+        # Wipe, COPY and insert share one transaction - a failure leaves the table as it was
+        with conn.cursor() as cursor:
+            if wipe_table is True:
+                for tbl in reversed(db.Base.metadata.sorted_tables):
+                    cursor.execute(f'DELETE FROM "{tbl.name}"')
+            # COPY into a staging table so only the ids of rows inserted here are returned
+            cursor.execute(
+                f"CREATE TEMP TABLE boundaries_load ON COMMIT DROP AS "
+                f"SELECT name, name_long, admin_level, geometry FROM {Boundary.__tablename__} WITH NO DATA"
+            )
+            cursor.copy_expert(
+                "COPY boundaries_load (name, name_long, admin_level, geometry) FROM STDIN",
+                copy_buffer,
+            )
+            cursor.execute(
+                f"INSERT INTO {Boundary.__tablename__} (name, name_long, admin_level, geometry) "
+                "SELECT name, name_long, admin_level, geometry FROM boundaries_load RETURNING id"
+            )
+            loaded_ids = [row[0] for row in cursor.fetchall()]
+        conn.commit()
+    except Exception as err:
+        print(f"Boundary insert failed due to {err}, rolling back transaction...")
+        conn.rollback()
+        loaded_ids = []
+    finally:
+        # Returns the connection to the pool
+        conn.close()
+    success = len(loaded_ids) == (total_features-skipped)
     return success, loaded_ids
 
 
@@ -140,4 +248,5 @@ if __name__ == "__main__":
         wipe_table = False
     print ('Loading with: ', fpath, name_column, long_name_column, wipe_table)
     all_loaded, ids = load_boundaries(fpath, name_column=name_column, long_name_column=long_name_column, wipe_table=wipe_table)
+    get_engine().dispose()
     print(f"Loaded {len(ids)} boundary features, success: {all_loaded}")
@@ -3,7 +3,17 @@ Global vars for test data
 """
 
 import os
-from config import LOCALFS_STORAGE_BACKEND_ROOT, LOCALFS_PROCESSING_BACKEND_ROOT
+from functools import lru_cache
+
+from config import (
+    LOCALFS_STORAGE_BACKEND_ROOT,
+    LOCALFS_PROCESSING_BACKEND_ROOT,
+    STORAGE_BACKEND,
+)
+from dataproc import Boundary
+from dataproc.backends import StorageBackend
+from dataproc.backends.storage import init_storage_backend
+from tests.helpers import load_country_geojson
 
 LOCAL_FS_PROCESSING_DATA_TOP_DIR = LOCALFS_PROCESSING_BACKEND_ROOT
 LOCAL_FS_PACKAGE_DATA_TOP_DIR = LOCALFS_STORAGE_BACKEND_ROOT
@@ -12,6 +22,73 @@ LOCAL_FS_PACKAGE_DATA_TOP_DIR = LOCALFS_STORAGE_BACKEND_ROOT
 os.makedirs(LOCAL_FS_PROCESSING_DATA_TOP_DIR, exist_ok=True)
 os.makedirs(LOCAL_FS_PACKAGE_DATA_TOP_DIR, exist_ok=True)
 
+
+@lru_cache(maxsize=None)
+def shared_boundary(name: str) -> Boundary:
+    """
+    Boundary for the given country, built once and shared between test classes
+    """
+    return Boundary(name, *load_country_geojson(name))
+
+
+@lru_cache(maxsize=1)
+def shared_storage_backend() -> StorageBackend:
+    """
+    Storage backend for the configured STORAGE_BACKEND, initialised once per test process
+    """
+    return init_storage_backend(STORAGE_BACKEND)
+
+
+class ProcessorTestsMixin:
+    """
+    Tests common to every processor TestCase
+
+    The TestCase sets processor_cls / metadata_cls and builds
+        self.proc, self.meta, self.task_executor, self.boundary, self.storage_backend
+        and self.test_processing_data_dir as usual
+    """
+
+    processor_cls = None
+    metadata_cls = None
+
+    def test_processor_init(self):
+        """"""
+        self.assertIsInstance(self.proc, self.processor_cls)
+
+    def test_context_manager(self):
+        """"""
+        with self.processor_cls(
+            self.meta,
+            self.boundary,
+            self.storage_backend,
+            self.task_executor,
+            self.test_processing_data_dir,
+        ) as proc:
+            self.assertIsInstance(proc, self.processor_cls)
+
+    def test_context_manager_cleanup_on_error(self):
+        """"""
+        with self.processor_cls(
+            self.meta,
+            self.boundary,
+            self.storage_backend,
+            self.task_executor,
+            self.test_processing_data_dir,
+        ) as proc:
+            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
+            # Add a file into the tmp processing backend
+            with open(test_fpath, "w") as fptr:
+                fptr.write("data")
+        self.assertFalse(os.path.exists(test_fpath))
+
+    def test_meta_init(self):
+        """"""
+        self.assertIsInstance(self.meta, self.metadata_cls)
+        self.assertNotEqual(self.meta.name, "")
+        self.assertNotEqual(self.meta.version, "")
+        self.assertNotEqual(self.meta.dataset_name, "")
+
+
 # Dummy Task Executor dor collecting progress
 class DummyTaskExecutor:
     progress = []
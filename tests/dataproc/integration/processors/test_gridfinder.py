@@ -6,24 +6,26 @@ import unittest
 import shutil
 
 
+from tests import TESTS_ROOT
 from tests.helpers import (
-    load_country_geojson,
+    fast_rmtree,
     assert_vector_output,
     assert_raster_output,
     assert_datapackage_resource,
     clean_packages
 )
 from tests.dataproc.integration.processors import (
+    ProcessorTestsMixin,
+    shared_boundary,
+    shared_storage_backend,
     LOCAL_FS_PROCESSING_DATA_TOP_DIR,
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
     DummyTaskExecutor,
 )
-from dataproc import Boundary
 from dataproc.processors.core.gridfinder.version_1 import (
     Processor,
     Metadata,
 )
-from dataproc.backends.storage import init_storage_backend
 from dataproc.backends.storage.awss3 import S3Manager
 from config import (
     PACKAGES_HOST_URL,
@@ -32,30 +34,26 @@ from config import (
     S3_BUCKET,
 )
 
-TEST_DATA_DIR = os.path.join(
-    os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    ),
-    "data",
-    "gridfinder",
-)
+TEST_DATA_DIR = os.path.join(TESTS_ROOT, "data", "gridfinder")
 
 
-class TestGridFinderV1Processor(unittest.TestCase):
+class TestGridFinderV1Processor(ProcessorTestsMixin, unittest.TestCase):
     """"""
 
+    processor_cls = Processor
+    metadata_cls = Metadata
+
     @classmethod
     def setUpClass(cls):
+        meta = Metadata()
         cls.test_processing_data_dir = os.path.join(
-            LOCAL_FS_PROCESSING_DATA_TOP_DIR, Metadata().name, Metadata().version
+            LOCAL_FS_PROCESSING_DATA_TOP_DIR, meta.name, meta.version
         )
-        os.makedirs(cls.test_processing_data_dir, exist_ok=True)
-        gambia_geojson, envelope_geojson = load_country_geojson("gambia")
-        cls.boundary = Boundary("gambia", gambia_geojson, envelope_geojson)
-        cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
+        cls.boundary = shared_boundary("gambia")
+        cls.storage_backend = shared_storage_backend()
         # Ensure clean test-env
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -68,7 +66,7 @@ class TestGridFinderV1Processor(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
+        fast_rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -89,43 +87,6 @@ class TestGridFinderV1Processor(unittest.TestCase):
             LOCAL_FS_PROCESSING_DATA_TOP_DIR,
         )
 
-    def test_processor_init(self):
-        """"""
-        self.assertIsInstance(self.proc, Processor)
-
-    def test_context_manager(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            self.assertIsInstance(proc, Processor)
-
-    def test_context_manager_cleanup_on_error(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
-            # Add a file into the tmp processing backend
-            with open(test_fpath, "w") as fptr:
-                fptr.write("data")
-        self.assertFalse(os.path.exists(test_fpath))
-
-    def test_meta_init(self):
-        """"""
-        self.assertIsInstance(self.meta, Metadata)
-        self.assertNotEqual(self.meta.name, "")
-        self.assertNotEqual(self.meta.version, "")
-        self.assertNotEqual(self.meta.dataset_name, "")
-
     def test_generate(self):
         """
         E2E generate test - fetch, crop, push
@@ -161,10 +122,10 @@ class TestGridFinderV1Processor(unittest.TestCase):
             prov_log[f"{self.proc.metadata.name} - move to storage success"]
         )
         # Collect the URIs for the final Raster
-        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"]
-        self.assertEqual(len(final_uris.split(",")), self.proc.total_expected_files)
+        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"].split(",")
+        self.assertEqual(len(final_uris), self.proc.total_expected_files)
         # Collect the original source fpaths for pixel assertion
-        for final_uri in final_uris.split(","):
+        for final_uri in final_uris:
             fname = os.path.basename(final_uri)
             if os.path.splitext(fname)[1] == ".tif":
                 # Match original source raster for pixel assertion
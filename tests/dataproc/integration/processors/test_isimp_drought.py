@@ -5,24 +5,26 @@ import os
 import unittest
 import shutil
 
+from tests import TESTS_ROOT
 from tests.helpers import (
-    load_country_geojson,
+    fast_rmtree,
     assert_raster_bounds_correct,
     assert_datapackage_resource,
     clean_packages,
     assert_raster_output
 )
 from tests.dataproc.integration.processors import (
+    ProcessorTestsMixin,
+    shared_boundary,
+    shared_storage_backend,
     LOCAL_FS_PROCESSING_DATA_TOP_DIR,
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
     DummyTaskExecutor
 )
-from dataproc import Boundary
 from dataproc.processors.core.isimp_drought.version_1 import (
     Processor,
     Metadata,
 )
-from dataproc.backends.storage import init_storage_backend
 from dataproc.backends.storage.awss3 import S3Manager
 from config import (
     PACKAGES_HOST_URL,
@@ -37,30 +39,26 @@ TEST_VERSION_1_SOURCE_FILES = [
     "lange2020_clm45_gfdl-esm2m_ewembi_rcp60_2005soc_co2_led_global_annual_2006_2099_2030_occurrence.tif"
 ]
 
-TEST_DATA_DIR = os.path.join(
-    os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    ),
-    "data",
-    "isimp_drought_v1",
-)
+TEST_DATA_DIR = os.path.join(TESTS_ROOT, "data", "isimp_drought_v1")
 
-class TestISIMPDroughtV1Processor(unittest.TestCase):
+class TestISIMPDroughtV1Processor(ProcessorTestsMixin, unittest.TestCase):
     """
     """
 
+    processor_cls = Processor
+    metadata_cls = Metadata
+
     @classmethod
     def setUpClass(cls):
+        meta = Metadata()
         cls.test_processing_data_dir = os.path.join(
-            LOCAL_FS_PROCESSING_DATA_TOP_DIR, Metadata().name, Metadata().version
+            LOCAL_FS_PROCESSING_DATA_TOP_DIR, meta.name, meta.version
         )
-        os.makedirs(cls.test_processing_data_dir, exist_ok=True)
-        gambia_geojson, envelope_geojson = load_country_geojson("gambia")
-        cls.boundary = Boundary("gambia", gambia_geojson, envelope_geojson)
-        cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
+        cls.boundary = shared_boundary("gambia")
+        cls.storage_backend = shared_storage_backend()
         # Ensure clean test-env
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -73,7 +71,7 @@ class TestISIMPDroughtV1Processor(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
+        fast_rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -94,43 +92,6 @@ class TestISIMPDroughtV1Processor(unittest.TestCase):
             LOCAL_FS_PROCESSING_DATA_TOP_DIR,
         )
 
-    def test_processor_init(self):
-        """"""
-        self.assertIsInstance(self.proc, Processor)
-
-    def test_context_manager(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            self.assertIsInstance(proc, Processor)
-
-    def test_context_manager_cleanup_on_error(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
-            # Add a file into the tmp processing backend
-            with open(test_fpath, "w") as fptr:
-                fptr.write("data")
-        self.assertFalse(os.path.exists(test_fpath))
-
-    def test_meta_init(self):
-        """"""
-        self.assertIsInstance(self.meta, Metadata)
-        self.assertNotEqual(self.meta.name, "")
-        self.assertNotEqual(self.meta.version, "")
-        self.assertNotEqual(self.meta.dataset_name, "")
-
     def test_generate(self):
         """E2E generate test - fetch, crop, push"""
         # Move test-data into the expected source folder
@@ -146,11 +107,11 @@ class TestISIMPDroughtV1Processor(unittest.TestCase):
         # Assert the log contains successful entries
         self.assertTrue(prov_log[f"{self.proc.metadata.name} - move to storage success"])
         # Collect the URIs for the final Rasters
-        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"]
-        self.assertEqual(len(final_uris.split(",")), self.proc.total_expected_files)
+        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"].split(",")
+        self.assertEqual(len(final_uris), self.proc.total_expected_files)
         # Collect the original source fpaths for pixel assertion
         source_fpaths = self.proc._fetch_source()
-        for idx, final_uri in enumerate(final_uris.split(",")):
+        for idx, final_uri in enumerate(final_uris):
             if STORAGE_BACKEND == "localfs":
                 assert_raster_output(
                     self.boundary["envelope_geojson"],
@@ -6,22 +6,23 @@ import unittest
 import shutil
 
 from tests.helpers import (
-    load_country_geojson,
+    fast_rmtree,
     assert_raster_output,
     assert_datapackage_resource,
     clean_packages
 )
 from tests.dataproc.integration.processors import (
+    ProcessorTestsMixin,
+    shared_boundary,
+    shared_storage_backend,
     LOCAL_FS_PROCESSING_DATA_TOP_DIR,
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
     DummyTaskExecutor,
 )
-from dataproc import Boundary
 from dataproc.processors.core.jrc_ghsl_population.r2022_epoch2020_1km import (
     Processor,
     Metadata,
 )
-from dataproc.backends.storage import init_storage_backend
 from dataproc.backends.storage.awss3 import S3Manager
 from config import (
     PACKAGES_HOST_URL,
@@ -31,21 +32,23 @@ from config import (
 )
 
 
-class TestJRCGHSLPopR2022E20201KMProcessor(unittest.TestCase):
+class TestJRCGHSLPopR2022E20201KMProcessor(ProcessorTestsMixin, unittest.TestCase):
     """"""
 
+    processor_cls = Processor
+    metadata_cls = Metadata
+
     @classmethod
     def setUpClass(cls):
+        meta = Metadata()
         cls.test_processing_data_dir = os.path.join(
-            LOCAL_FS_PROCESSING_DATA_TOP_DIR, Metadata().name, Metadata().version
+            LOCAL_FS_PROCESSING_DATA_TOP_DIR, meta.name, meta.version
         )
-        os.makedirs(cls.test_processing_data_dir, exist_ok=True)
-        gambia_geojson, envelope_geojson = load_country_geojson("gambia")
-        cls.boundary = Boundary("gambia", gambia_geojson, envelope_geojson)
-        cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
+        cls.boundary = shared_boundary("gambia")
+        cls.storage_backend = shared_storage_backend()
         # Ensure clean test-env
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -58,7 +61,7 @@ class TestJRCGHSLPopR2022E20201KMProcessor(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
+        fast_rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -84,43 +87,6 @@ class TestJRCGHSLPopR2022E20201KMProcessor(unittest.TestCase):
             "GHS_POP_E2020_GLOBE_R2022A_54009_1000_V1_0_R8_C17.zip"
         ]
 
-    def test_processor_init(self):
-        """"""
-        self.assertIsInstance(self.proc, Processor)
-
-    def test_context_manager(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            self.assertIsInstance(proc, Processor)
-
-    def test_context_manager_cleanup_on_error(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
-            # Add a file into the tmp processing backend
-            with open(test_fpath, "w") as fptr:
-                fptr.write("data")
-        self.assertFalse(os.path.exists(test_fpath))
-
-    def test_meta_init(self):
-        """"""
-        self.assertIsInstance(self.meta, Metadata)
-        self.assertNotEqual(self.meta.name, "")
-        self.assertNotEqual(self.meta.version, "")
-        self.assertNotEqual(self.meta.dataset_name, "")
-
     def test_generate(self):
         """E2E generate test - fetch, crop, push"""
         clean_packages(
@@ -7,23 +7,24 @@ import shutil
 
 
 from tests.helpers import (
-    load_country_geojson,
+    fast_rmtree,
     assert_raster_output,
     assert_datapackage_resource,
     clean_packages
 )
 from tests.dataproc.integration.processors import (
+    ProcessorTestsMixin,
+    shared_boundary,
+    shared_storage_backend,
     LOCAL_FS_PROCESSING_DATA_TOP_DIR,
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
     DummyTaskExecutor,
 )
-from dataproc import Boundary
 from dataproc.helpers import sample_geotiff
 from dataproc.processors.core.natural_earth_raster.version_1 import (
     Processor,
     Metadata,
 )
-from dataproc.backends.storage import init_storage_backend
 from dataproc.backends.storage.awss3 import S3Manager
 from config import (
     PACKAGES_HOST_URL,
@@ -33,21 +34,23 @@ from config import (
 )
 
 
-class TestNaturalEarthRasterProcessor(unittest.TestCase):
+class TestNaturalEarthRasterProcessor(ProcessorTestsMixin, unittest.TestCase):
     """"""
 
+    processor_cls = Processor
+    metadata_cls = Metadata
+
     @classmethod
     def setUpClass(cls):
+        meta = Metadata()
         cls.test_processing_data_dir = os.path.join(
-            LOCAL_FS_PROCESSING_DATA_TOP_DIR, Metadata().name, Metadata().version
+            LOCAL_FS_PROCESSING_DATA_TOP_DIR, meta.name, meta.version
         )
-        os.makedirs(cls.test_processing_data_dir, exist_ok=True)
-        gambia_geojson, envelope_geojson = load_country_geojson("gambia")
-        cls.boundary = Boundary("gambia", gambia_geojson, envelope_geojson)
-        cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
+        cls.boundary = shared_boundary("gambia")
+        cls.storage_backend = shared_storage_backend()
         # Ensure clean test-env
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -71,7 +74,7 @@ class TestNaturalEarthRasterProcessor(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        fast_rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -81,43 +84,6 @@ class TestNaturalEarthRasterProcessor(unittest.TestCase):
             packages=["gambia"],
         )
 
-    def test_processor_init(self):
-        """"""
-        self.assertIsInstance(self.proc, Processor)
-
-    def test_context_manager(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            self.assertIsInstance(proc, Processor)
-
-    def test_context_manager_cleanup_on_error(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
-            # Add a file into the tmp processing backend
-            with open(test_fpath, "w") as fptr:
-                fptr.write("data")
-        self.assertFalse(os.path.exists(test_fpath))
-
-    def test_meta_init(self):
-        """"""
-        self.assertIsInstance(self.meta, Metadata)
-        self.assertNotEqual(self.meta.name, "")
-        self.assertNotEqual(self.meta.version, "")
-        self.assertNotEqual(self.meta.dataset_name, "")
-
     def test_fetch_source(self):
         """Test the fetching of source zip, unpacking and assertion"""
         gtiff_fpath = self.proc._fetch_source()
@@ -144,7 +110,8 @@ class TestNaturalEarthRasterProcessor(unittest.TestCase):
             assert_raster_output(
                 self.boundary["envelope_geojson"],
                 final_uri.replace(PACKAGES_HOST_URL, LOCAL_FS_PACKAGE_DATA_TOP_DIR),
-                pixel_check_raster_fpath=self.proc._fetch_source()
+                pixel_check_raster_fpath=self.proc._fetch_source(),
+                check_is_cog=True,
             )
         elif STORAGE_BACKEND == "awss3":
             with S3Manager(*self.storage_backend._parse_env(), region=S3_REGION) as s3_fs:
@@ -152,7 +119,8 @@ class TestNaturalEarthRasterProcessor(unittest.TestCase):
                     self.boundary["envelope_geojson"],
                     s3_fs=s3_fs,
                     s3_raster_fpath=final_uri.replace(PACKAGES_HOST_URL, S3_BUCKET),
-                    pixel_check_raster_fpath=self.proc._fetch_source()
+                    pixel_check_raster_fpath=self.proc._fetch_source(),
+                    check_is_cog=True,
                 )
         # Check the datapackage thats included in the prov log
         self.assertIn("datapackage", prov_log.keys())
@@ -3,10 +3,11 @@ Unit tests for Natural Earth Vector Processor
 """
 import os
 import unittest
+from unittest.mock import patch
 import shutil
 
 from tests.helpers import (
-    load_country_geojson,
+    fast_rmtree,
     assert_table_in_pg,
     drop_natural_earth_roads_from_pg,
     assert_exists_awss3,
@@ -14,13 +15,14 @@ from tests.helpers import (
     clean_packages
 )
 from tests.dataproc.integration.processors import (
+    ProcessorTestsMixin,
+    shared_boundary,
+    shared_storage_backend,
     LOCAL_FS_PROCESSING_DATA_TOP_DIR,
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
     DummyTaskExecutor
 )
-from dataproc.backends.storage import init_storage_backend
 from dataproc.backends.storage.awss3 import S3Manager
-from dataproc import Boundary
 from dataproc.processors.core.natural_earth_vector.version_1 import (
     Processor,
     Metadata,
@@ -28,22 +30,27 @@ from dataproc.processors.core.natural_earth_vector.version_1 import (
 from config import get_db_uri_sync, API_POSTGRES_DB, PACKAGES_HOST_URL, S3_REGION, STORAGE_BACKEND, S3_BUCKET
 
 
-class TestNaturalEarthVectorProcessor(unittest.TestCase):
+class TestNaturalEarthVectorProcessor(ProcessorTestsMixin, unittest.TestCase):
     """"""
 
+    processor_cls = Processor
+    metadata_cls = Metadata
+
     @classmethod
     def setUpClass(cls):
+        meta = Metadata()
         cls.test_processing_data_dir = os.path.join(
-            LOCAL_FS_PROCESSING_DATA_TOP_DIR, Metadata().name, Metadata().version
+            LOCAL_FS_PROCESSING_DATA_TOP_DIR, meta.name, meta.version
         )
-        os.makedirs(cls.test_processing_data_dir, exist_ok=True)
         cls.test_data_dir = None
-        gambia_geojson, envelope_geojson = load_country_geojson("gambia")
-        cls.boundary = Boundary("gambia", gambia_geojson, envelope_geojson)
-        cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
+        cls.boundary = shared_boundary("gambia")
+        cls.storage_backend = shared_storage_backend()
         # Ensure clean test-env
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
+        # Source table is loaded once (by the first test needing it) and reused for the rest of the class
+        cls.source_table = None
+        Processor.drop_natural_earth_roads_from_pg()
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -57,7 +64,7 @@ class TestNaturalEarthVectorProcessor(unittest.TestCase):
     def tearDownClass(cls):
         # Cleans processing data
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        fast_rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -82,42 +89,11 @@ class TestNaturalEarthVectorProcessor(unittest.TestCase):
             self.test_processing_data_dir,
         )
 
-    def test_processor_init(self):
-        """"""
-        self.assertIsInstance(self.proc, Processor)
-
-    def test_context_manager(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            self.assertIsInstance(proc, Processor)
-
-    def test_context_manager_cleanup_on_error(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
-            # Add a file into the tmp processing backend
-            with open(test_fpath, "w") as fptr:
-                fptr.write("data")
-        self.assertFalse(os.path.exists(test_fpath))
-
-    def test_meta_init(self):
-        """"""
-        self.assertIsInstance(self.meta, Metadata)
-        self.assertNotEqual(self.meta.name, "")
-        self.assertNotEqual(self.meta.version, "")
-        self.assertNotEqual(self.meta.dataset_name, "")
+    def fetch_source_once(self) -> str:
+        """Load the source table to PG on first use, returning the loaded table for the rest of the class"""
+        if self.__class__.source_table is None:
+            self.__class__.source_table = self.proc._fetch_source()
+        return self.__class__.source_table
 
     def test_fetch_zip(self):
         """Test the fetching of source zip, unpacking and assertion"""
@@ -126,7 +102,7 @@ class TestNaturalEarthVectorProcessor(unittest.TestCase):
 
     def test_fetch_source(self):
         """Test the fetching of source zip, unpacking and assertion"""
-        tablename = self.proc._fetch_source()
+        tablename = self.fetch_source_once()
         assert_table_in_pg(get_db_uri_sync(API_POSTGRES_DB), tablename)
 
     def test_generate(self):
@@ -139,7 +115,9 @@ class TestNaturalEarthVectorProcessor(unittest.TestCase):
             s3_region=S3_REGION,
             packages=["gambia"],
         )
-        prov_log = self.proc.generate()
+        # Crop from the class-level source table rather than re-ingesting it
+        with patch.object(self.proc, "_fetch_source", self.fetch_source_once):
+            prov_log = self.proc.generate()
         # # Assert the log contains a succesful entries
         self.assertTrue(prov_log[f"{self.proc.metadata.name} - crop completed"])
         self.assertTrue(prov_log[f"{self.proc.metadata.name} - move to storage success"])
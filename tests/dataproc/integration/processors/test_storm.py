@@ -6,23 +6,23 @@ import unittest
 import shutil
 
 from tests.helpers import (
-    load_country_geojson,
     assert_raster_output,
     assert_datapackage_resource,
     clean_packages
 )
 from tests.dataproc.integration.processors import (
+    ProcessorTestsMixin,
+    shared_boundary,
+    shared_storage_backend,
     LOCAL_FS_PROCESSING_DATA_TOP_DIR,
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
     DummyTaskExecutor,
 )
-from dataproc import Boundary
 from dataproc.processors.core.storm.global_mosaics_version_1 import (
     Processor,
     Metadata,
 )
 from dataproc.helpers import assert_geotiff, download_file
-from dataproc.backends.storage import init_storage_backend
 from dataproc.backends.storage.awss3 import S3Manager
 from config import (
     PACKAGES_HOST_URL,
@@ -34,21 +34,23 @@ from config import (
 TEST_TIF_URL = "https://zenodo.org/record/7438145/files/STORM_FIXED_RETURN_PERIODS_CMCC-CM2-VHR4_10000_YR_RP.tif"
 
 
-class TestStormV1Processor(unittest.TestCase):
+class TestStormV1Processor(ProcessorTestsMixin, unittest.TestCase):
     """"""
 
+    processor_cls = Processor
+    metadata_cls = Metadata
+
     @classmethod
     def setUpClass(cls):
+        meta = Metadata()
         cls.test_processing_data_dir = os.path.join(
-            LOCAL_FS_PROCESSING_DATA_TOP_DIR, Metadata().name, Metadata().version
+            LOCAL_FS_PROCESSING_DATA_TOP_DIR, meta.name, meta.version
         )
-        os.makedirs(cls.test_processing_data_dir, exist_ok=True)
-        gambia_geojson, envelope_geojson = load_country_geojson("gambia")
-        cls.boundary = Boundary("gambia", gambia_geojson, envelope_geojson)
-        cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
+        cls.boundary = shared_boundary("gambia")
+        cls.storage_backend = shared_storage_backend()
         # Ensure clean test-env
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -80,43 +82,6 @@ class TestStormV1Processor(unittest.TestCase):
             self.test_processing_data_dir,
         )
 
-    def test_processor_init(self):
-        """"""
-        self.assertIsInstance(self.proc, Processor)
-
-    def test_context_manager(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            self.assertIsInstance(proc, Processor)
-
-    def test_context_manager_cleanup_on_error(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
-            # Add a file into the tmp processing backend
-            with open(test_fpath, "w") as fptr:
-                fptr.write("data")
-        self.assertFalse(os.path.exists(test_fpath))
-
-    def test_meta_init(self):
-        """"""
-        self.assertIsInstance(self.meta, Metadata)
-        self.assertNotEqual(self.meta.name, "")
-        self.assertNotEqual(self.meta.version, "")
-        self.assertNotEqual(self.meta.dataset_name, "")
-
     def test_generate(self):
         """E2E generate test - fetch, crop, push"""
         clean_packages(
@@ -137,11 +102,11 @@ class TestStormV1Processor(unittest.TestCase):
         # Assert the log contains successful entries
         self.assertTrue(prov_log[f"{self.proc.metadata.name} - move to storage success"])
         # Collect the URIs for the final Raster
-        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"]
-        self.assertEqual(len(final_uris.split(",")), self.proc.total_expected_files)
+        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"].split(",")
+        self.assertEqual(len(final_uris), self.proc.total_expected_files)
         # Collect the original source fpaths for pixel assertion
         source_fpaths = self.proc._fetch_source()
-        for idx, final_uri in enumerate(final_uris.split(",")):
+        for idx, final_uri in enumerate(final_uris):
             # # Assert the geotiffs are valid
             if STORAGE_BACKEND == "localfs":
                 assert_raster_output(
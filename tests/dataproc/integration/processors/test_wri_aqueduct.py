@@ -6,25 +6,27 @@ import unittest
 import shutil
 
 from tests.helpers import (
-    load_country_geojson,
+    fast_rmtree,
     assert_raster_bounds_correct,
     setup_test_data_paths,
     assert_raster_output,
+    envelope_bounds,
     assert_datapackage_resource,
     clean_packages
 )
 from tests.dataproc.integration.processors import (
+    ProcessorTestsMixin,
+    shared_boundary,
+    shared_storage_backend,
     LOCAL_FS_PROCESSING_DATA_TOP_DIR,
     LOCAL_FS_PACKAGE_DATA_TOP_DIR,
     DummyTaskExecutor
 )
-from dataproc import Boundary
 from dataproc.helpers import tiffs_in_folder
 from dataproc.processors.core.wri_aqueduct.version_2 import (
     Processor,
     Metadata,
 )
-from dataproc.backends.storage import init_storage_backend
 from dataproc.backends.storage.awss3 import S3Manager
 from config import (
     PACKAGES_HOST_URL,
@@ -34,21 +36,23 @@ from config import (
 )
 
 
-class TestWRIAqueductProcessor(unittest.TestCase):
+class TestWRIAqueductProcessor(ProcessorTestsMixin, unittest.TestCase):
     """"""
 
+    processor_cls = Processor
+    metadata_cls = Metadata
+
     @classmethod
     def setUpClass(cls):
+        meta = Metadata()
         cls.test_processing_data_dir = os.path.join(
-            LOCAL_FS_PROCESSING_DATA_TOP_DIR, Metadata().name, Metadata().version
+            LOCAL_FS_PROCESSING_DATA_TOP_DIR, meta.name, meta.version
         )
-        os.makedirs(cls.test_processing_data_dir, exist_ok=True)
-        gambia_geojson, envelope_geojson = load_country_geojson("gambia")
-        cls.boundary = Boundary("gambia", gambia_geojson, envelope_geojson)
-        cls.storage_backend = init_storage_backend(STORAGE_BACKEND)
+        cls.boundary = shared_boundary("gambia")
+        cls.storage_backend = shared_storage_backend()
         # Ensure clean test-env
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        shutil.rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -61,7 +65,7 @@ class TestWRIAqueductProcessor(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # Tmp and Source data
-        shutil.rmtree(cls.test_processing_data_dir)
+        fast_rmtree(cls.test_processing_data_dir, ignore_errors=True)
         # Package data
         clean_packages(
             STORAGE_BACKEND,
@@ -82,43 +86,6 @@ class TestWRIAqueductProcessor(unittest.TestCase):
             LOCAL_FS_PROCESSING_DATA_TOP_DIR,
         )
 
-    def test_processor_init(self):
-        """"""
-        self.assertIsInstance(self.proc, Processor)
-
-    def test_context_manager(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            self.assertIsInstance(proc, Processor)
-
-    def test_context_manager_cleanup_on_error(self):
-        """"""
-        with Processor(
-            self.meta,
-            self.boundary,
-            self.storage_backend,
-            self.task_executor,
-            self.test_processing_data_dir,
-        ) as proc:
-            test_fpath = os.path.join(proc.tmp_processing_folder, "testfile")
-            # Add a file into the tmp processing backend
-            with open(test_fpath, "w") as fptr:
-                fptr.write("data")
-        self.assertFalse(os.path.exists(test_fpath))
-
-    def test_meta_init(self):
-        """"""
-        self.assertIsInstance(self.meta, Metadata)
-        self.assertNotEqual(self.meta.name, "")
-        self.assertNotEqual(self.meta.version, "")
-        self.assertNotEqual(self.meta.dataset_name, "")
-
     def test_generate(self):
         """E2E generate test - fetch, crop, push"""
         clean_packages(
@@ -134,24 +101,27 @@ class TestWRIAqueductProcessor(unittest.TestCase):
         # Assert the log contains successful entries
         self.assertTrue(prov_log[f"{self.proc.metadata.name} - move to storage success"])
         # Collect the URIs for the final Raster
-        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"]
-        self.assertEqual(len(final_uris.split(",")), self.proc.total_expected_files)
+        final_uris = prov_log[f"{self.proc.metadata.name} - result URIs"].split(",")
+        self.assertEqual(len(final_uris), self.proc.total_expected_files)
         # Collect the original source fpaths for pixel assertion
         source_tiffs = tiffs_in_folder(self.proc.source_folder)
-        for idx, final_uri in enumerate(final_uris.split(",")):
+        bounds = envelope_bounds(self.boundary["envelope_geojson"])
+        for idx, final_uri in enumerate(final_uris):
             if STORAGE_BACKEND == "localfs":
                 assert_raster_output(
-                    self.boundary["envelope_geojson"],
+                    bounds,
                     final_uri.replace(PACKAGES_HOST_URL, LOCAL_FS_PACKAGE_DATA_TOP_DIR),
-                    pixel_check_raster_fpath=os.path.join(self.proc.source_folder, source_tiffs[idx])
+                    pixel_check_raster_fpath=os.path.join(self.proc.source_folder, source_tiffs[idx]),
+                    check_is_cog=True,
                 )
             elif STORAGE_BACKEND == "awss3":
                 with S3Manager(*self.storage_backend._parse_env(), region=S3_REGION) as s3_fs:
                     assert_raster_output(
-                        self.boundary["envelope_geojson"],
+                        bounds,
                         s3_fs=s3_fs,
                         s3_raster_fpath=final_uri.replace(PACKAGES_HOST_URL, S3_BUCKET),
-                        pixel_check_raster_fpath=os.path.join(self.proc.source_folder, source_tiffs[idx])
+                        pixel_check_raster_fpath=os.path.join(self.proc.source_folder, source_tiffs[idx]),
+                        check_is_cog=True,
                     )
             else:
                 pass
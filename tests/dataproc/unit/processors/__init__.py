@@ -4,18 +4,8 @@ Global vars for test data
 
 import os
 
-LOCAL_FS_PROCESSING_DATA_TOP_DIR = os.path.join(
-    os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    ),
-    "data",
-    "tmp",
-)
+from tests import TESTS_ROOT
 
-LOCAL_FS_PACKAGE_DATA_TOP_DIR = os.path.join(
-    os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    ),
-    "data",
-    "package_bucket",
-)
\ No newline at end of file
+LOCAL_FS_PROCESSING_DATA_TOP_DIR = os.path.join(TESTS_ROOT, "data", "tmp")
+
+LOCAL_FS_PACKAGE_DATA_TOP_DIR = os.path.join(TESTS_ROOT, "data", "package_bucket")
\ No newline at end of file
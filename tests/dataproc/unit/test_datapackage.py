@@ -12,12 +12,9 @@ from dataproc.processors.core.test_processor.version_1 import (
     Metadata as TestProcMetadata,
 )
 from dataproc import DataPackageResource
+from tests import TESTS_ROOT
 
-LOCAL_FS_DATA_TOP_DIR = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-    "data",
-    "packages",
-)
+LOCAL_FS_DATA_TOP_DIR = os.path.join(TESTS_ROOT, "data", "packages")
 
 
 class TestDataPackage(unittest.TestCase):
@@ -0,0 +1,94 @@
+"""
+Unit tests for Dataproc Helper Methods
+"""
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from dataproc import Boundary
+from dataproc.helpers import crop_raster, download_file, raster_bounds_disjoint
+from tests import TESTS_ROOT
+from tests.helpers import load_country_geojson
+
+TEST_RASTER_FPATH = os.path.join(
+    TESTS_ROOT,
+    "data",
+    "isimp_drought_v1",
+    "lange2020_clm45_gfdl-esm2m_ewembi_rcp60_2005soc_co2_led_global_annual_2006_2099_2030_occurrence.tif",
+)
+
+
+class TestDataprocHelpers(unittest.TestCase):
+    """"""
+
+    def test_raster_bounds_disjoint(self):
+        """Bounding box overlap checks used to skip raster crops"""
+        raster_bounds = (-180.0, -90.0, 180.0, 90.0)
+        self.assertFalse(raster_bounds_disjoint(raster_bounds, (-17.0, 13.0, -13.0, 14.0)))
+        # Partial overlap
+        self.assertFalse(raster_bounds_disjoint((0.0, 0.0, 10.0, 10.0), (5.0, 5.0, 15.0, 15.0)))
+        # No overlap in x or y
+        self.assertTrue(raster_bounds_disjoint((0.0, 0.0, 10.0, 10.0), (11.0, 0.0, 15.0, 10.0)))
+        self.assertTrue(raster_bounds_disjoint((0.0, 0.0, 10.0, 10.0), (0.0, -5.0, 10.0, -1.0)))
+
+    def test_crop_raster_gdal_config_options(self):
+        """GDAL config options are applied for the crop and restored afterwards"""
+        from osgeo import gdal
+
+        boundary = Boundary("gambia", *load_country_geojson("gambia"))
+        gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", None)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_fpath = os.path.join(tmp_dir, "gambia.tif")
+            result = crop_raster(
+                TEST_RASTER_FPATH,
+                output_fpath,
+                boundary,
+                gdal_config_options={"GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR"},
+            )
+            self.assertTrue(result)
+            self.assertTrue(os.path.exists(output_fpath))
+        self.assertIsNone(gdal.GetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN"))
+
+    def test_download_file_cache_hit(self):
+        """A cached download is copied into place without any request being made"""
+        source_url = "http://example.com/source.zip"
+        with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as tmp_dir:
+            cache_fpath = os.path.join(cache_dir, hashlib.sha256(source_url.encode()).hexdigest())
+            with open(cache_fpath, "wb") as fptr:
+                fptr.write(b"cached")
+            destination_fpath = os.path.join(tmp_dir, "source.zip")
+            with patch("dataproc.helpers.DOWNLOAD_CACHE_DIR", cache_dir), patch(
+                "dataproc.helpers._download_file_ranges",
+                side_effect=AssertionError("download attempted on cache hit"),
+            ):
+                self.assertEqual(download_file(source_url, destination_fpath), destination_fpath)
+            with open(destination_fpath, "rb") as fptr:
+                self.assertEqual(fptr.read(), b"cached")
+
+    def test_download_file_cache_write_failure(self):
+        """An unwritable cache leaves the download in place, with no temporary cache files"""
+
+        def _fake_download(source_url, destination_fpath):
+            with open(destination_fpath, "wb") as fptr:
+                fptr.write(b"downloaded")
+            return True
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # A file where the cache folder should be, so creating the cache fails
+            cache_dir = os.path.join(tmp_dir, "cache")
+            with open(cache_dir, "w") as fptr:
+                fptr.write("")
+            destination_fpath = os.path.join(tmp_dir, "source.zip")
+            with patch("dataproc.helpers.DOWNLOAD_CACHE_DIR", cache_dir), patch(
+                "dataproc.helpers._download_file_ranges", side_effect=_fake_download
+            ):
+                with self.assertWarns(UserWarning):
+                    result = download_file("http://example.com/source.zip", destination_fpath)
+            self.assertEqual(result, destination_fpath)
+            with open(destination_fpath, "rb") as fptr:
+                self.assertEqual(fptr.read(), b"downloaded")
+            self.assertEqual(
+                [fname for fname in os.listdir(tmp_dir) if fname.endswith(".tmp")], []
+            )
@@ -3,55 +3,156 @@ Test Helpers
 """
 import os
 import sys
-import inspect
 import json
-from typing import Any, List, Tuple
-import shutil
+from functools import lru_cache
+from typing import Any, List, Tuple, Union
 from time import sleep, time
+from concurrent.futures import ThreadPoolExecutor
 
 import sqlalchemy as sa
+import requests
 import rasterio
-import shapely
-from shapely.ops import transform
-import pyproj
 from pyarrow import fs
 from pyarrow.fs import S3FileSystem, LocalFileSystem
-import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from config import get_db_uri_sync, API_POSTGRES_DB, INTEGRATION_TEST_ENDPOINT
 from api import db
-from dataproc.helpers import assert_geotiff, assert_vector_file, sample_geotiff, sample_geotiff_coords
+from api.routes import JOB_STATUS_ROUTE
+from dataproc.helpers import (
+    assert_geotiff,
+    assert_vector_file,
+    ogr2ogr_load_shapefile_to_pg,
+    open_raster,
+    sample_geotiff,
+    sample_geotiff_coords,
+)
 from dataproc.backends.storage.awss3 import S3Manager, AWSS3StorageBackend
 
-current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(os.path.dirname(current_dir))
-sys.path.insert(0, parent_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 test_data_dir = os.path.join(current_dir, "data")
 
+
+@lru_cache(maxsize=8)
+def engine_for(db_uri: sa.engine.URL) -> sa.engine.Engine:
+    """SQLA Engine (and its connection pool) for the given DB URI, created once per test process"""
+    return sa.create_engine(db_uri, pool_pre_ping=True)
+
+
 db_uri = get_db_uri_sync(API_POSTGRES_DB)
 # Init DB and Load via SA
-engine = sa.create_engine(db_uri, pool_pre_ping=True)
+engine = engine_for(db_uri)
 
 
 def wipe_db(setup_tables=True):
     """Wipe all SQLA Tables in the DB"""
-    db_uri = get_db_uri_sync(API_POSTGRES_DB)
-    # Init DB and Load via SA
-    engine = sa.create_engine(db_uri, pool_pre_ping=True)
     if setup_tables:
         db.Base.metadata.create_all(engine)
-    for tbl in reversed(db.Base.metadata.sorted_tables):
-        engine.execute(tbl.delete())
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            # Single statement for all tables, skipping row-by-row deletes
+            table_names = ", ".join(
+                f'"{tbl.name}"' for tbl in db.Base.metadata.sorted_tables
+            )
+            conn.execute(sa.text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
+        else:
+            for tbl in reversed(db.Base.metadata.sorted_tables):
+                conn.execute(tbl.delete())
 
 
 def build_route(postfix_url: str):
     return "{}{}".format(INTEGRATION_TEST_ENDPOINT, postfix_url)
 
 
+def wait_for_jobs(
+    job_ids: List[str],
+    max_await: float,
+    initial_interval: float = 0.02,
+    max_interval: float = 0.5,
+    backoff: float = 1.3,
+    session: requests.Session = None,
+) -> List[dict]:
+    """
+    Poll the job status route until all given jobs are no longer PENDING
+
+    The poll interval starts short and backs off towards max_interval,
+        so quick jobs are picked up promptly without hammering the API during longer ones.
+
+    ::param job_ids List[str] Jobs to await
+    ::param max_await float Seconds before giving up (fails the calling test)
+    ::kwarg session requests.Session Optional session to reuse connections across polls
+
+    ::returns statuses List[dict] Final job status response body for each job (in the given order)
+    """
+    http = session if session is not None else requests
+    # Status routes are built once up front rather than on every poll
+    routes = [build_route(JOB_STATUS_ROUTE.format(job_id=job_id)) for job_id in job_ids]
+    statuses = [None for _ in job_ids]
+    interval = initial_interval
+    start = time()
+    while True:
+        # Polled one after another - requests.Session is not thread-safe, and there are only a few jobs
+        for idx, route in enumerate(routes):
+            if not statuses[idx] or statuses[idx]["job_group_status"] == "PENDING":
+                statuses[idx] = http.get(route).json()
+        if all([status["job_group_status"] != "PENDING" for status in statuses]):
+            return statuses
+        if (time() - start) > max_await:
+            raise AssertionError("max await reached")
+        sleep(interval)
+        interval = min(interval * backoff, max_interval)
+
+
+def fast_rmtree(path: str, ignore_errors: bool = False, max_workers: int = 16):
+    """
+    Remove a directory tree, unlinking the files in each folder concurrently
+
+    Drop-in for shutil.rmtree in test teardown (symlinks are unlinked, not followed)
+        with ignore_errors, entries that cannot be removed are skipped and the rest of the tree is still removed
+    """
+
+    def _attempt(func, *args):
+        try:
+            func(*args)
+        except OSError:
+            if not ignore_errors:
+                raise
+
+    def _remove_folder(folder_path: str, pool: ThreadPoolExecutor):
+        futures = []
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        _remove_folder(entry.path, pool)
+                    else:
+                        futures.append(pool.submit(_attempt, os.unlink, entry.path))
+        except OSError:
+            if not ignore_errors:
+                raise
+        for future in futures:
+            future.result()
+        _attempt(os.rmdir, folder_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        _remove_folder(path, pool)
+
+
+@lru_cache(maxsize=None)
 def load_country_geojson(name: str) -> Tuple[dict, dict]:
     """
     Load the geojson boundary and envelope for a given country
+
+    Parsed once per test process - the returned dicts are shared
+    between callers and must not be modified
     """
     with open(os.path.join(test_data_dir, "countries", f"{name}.geojson"), "r") as fptr:
         boundary = json.load(fptr)
@@ -71,52 +172,108 @@ def load_natural_earth_roads_to_pg():
     """
     pguri = str(get_db_uri_sync(API_POSTGRES_DB)).replace("+psycopg2", "")
     fpath = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "data",
+        test_data_dir,
         "global",
         "ne_10m_roads",
         "ne_10m_roads.shp",
     )
-    cmd = f'ogr2ogr -f "PostgreSQL" -nlt PROMOTE_TO_MULTI PG:"{pguri}" "{fpath}"'
-    os.system(cmd)
+    ogr2ogr_load_shapefile_to_pg(fpath, pguri)
 
 
 def drop_natural_earth_roads_from_pg():
     """Drop loaded Natural Earth Roads data from DB"""
-    db_uri = get_db_uri_sync(API_POSTGRES_DB)
-    # Init DB and Load via SA
-    engine = sa.create_engine(db_uri, pool_pre_ping=True)
-    _ = engine.execute("DROP TABLE ne_10m_roads;")
+    with engine.begin() as conn:
+        conn.execute(sa.text("DROP TABLE ne_10m_roads;"))
+
+
+TEST_DP_LICENSE = {
+    "name": "ODbL-1.0",
+    "path": "https://opendefinition.org/licenses/odc-odbl",
+    "title": "Open Data Commons Open Database License 1.0",
+}
+
+# Shared by every test datapackage resource - only the name differs
+#   (tuples so the shared template cannot be mutated; they serialise as JSON lists)
+TEST_DP_RESOURCE_TEMPLATE = {
+    "version": "version_1",
+    "path": ("data.gpkg",),
+    "description": "desc",
+    "format": "GEOPKG",
+    "hashes": ("d7bbfe3d26e2142ee24458df087ed154194fe5de",),
+    "bytes": 22786048,
+    "license": TEST_DP_LICENSE,
+    "sources": ("a url",),
+}
 
 
 def gen_datapackage(boundary_name: str, dataset_names: List[str]) -> dict:
     """A test datapackage"""
-    dp_license = {
-        "name": "ODbL-1.0",
-        "path": "https://opendefinition.org/licenses/odc-odbl",
-        "title": "Open Data Commons Open Database License 1.0",
-    }
     return {
         "name": boundary_name,
         "title": boundary_name,
-        "licenses": [dp_license for _ in dataset_names],
+        "licenses": [TEST_DP_LICENSE] * len(dataset_names),
         "resources": [
-            {
-                "name": dataset_name,
-                "version": "version_1",
-                "path": ["data.gpkg"],
-                "description": "desc",
-                "format": "GEOPKG",
-                "hashes": ["d7bbfe3d26e2142ee24458df087ed154194fe5de"],
-                "bytes": 22786048,
-                "license": dp_license,
-                "sources": ["a url"],
-            }
+            {"name": dataset_name, **TEST_DP_RESOURCE_TEMPLATE}
             for dataset_name in dataset_names
         ],
     }
 
 
+@lru_cache(maxsize=32)
+def gen_datapackage_json(boundary_name: str, dataset_names: Tuple[str, ...]) -> bytes:
+    """A test datapackage, serialised (compact, UTF-8) once per boundary / datasets combination"""
+    datapkg = gen_datapackage(boundary_name, list(dataset_names))
+    if orjson is not None:
+        return orjson.dumps(datapkg)
+    return json.dumps(datapkg, separators=(",", ":")).encode("utf-8")
+
+
+# Dataset versions placed in the fake package trees
+#   "noexist" is an invalid processor / dataset with no versions
+TEST_TREE_DATASET_VERSIONS = {
+    "gambia": {
+        "noexist": None,
+        "aqueduct": "0.1",
+        "biodiversity": "version_1",
+        "osm_roads": "20221201",
+        "natural_earth_raster": "version_1",
+    },
+    "zambia": {
+        "osm_roads": "20230401",
+    },
+}
+
+
+def _test_tree_leaves(packages: list, datasets: list) -> List[str]:
+    """Relative leaf folders of the fake package tree for the given packages and datasets"""
+    leaves = []
+    for package in packages:
+        for dataset, version in TEST_TREE_DATASET_VERSIONS.get(package, {}).items():
+            if dataset in datasets:
+                leaf = [package, "datasets", dataset] + ([version] if version else [])
+                leaves.append(os.path.join(*leaf))
+    return leaves
+
+
+def _makedirs_batch(top_level_path: str, relative_paths: List[str]):
+    """
+    Create the given folders beneath top_level_path,
+        issuing at most one mkdir per distinct folder (shared prefixes are created once)
+    """
+    created = set()
+    for relative_path in sorted(relative_paths):
+        path = top_level_path
+        for part in relative_path.split(os.sep):
+            path = os.path.join(path, part)
+            if path in created:
+                continue
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass
+            created.add(path)
+
+
 def create_tree(
     top_level_path: str,
     packages: list = ["gambia", "zambia"],
@@ -129,58 +286,21 @@ def create_tree(
     # Generate the datapackage.jsons
     for package in packages:
         if wipe_existing is True:
-            shutil.rmtree(os.path.join(top_level_path, package), ignore_errors=True)
+            fast_rmtree(os.path.join(top_level_path, package), ignore_errors=True)
         os.makedirs(os.path.join(top_level_path, package), exist_ok=True)
-        dp = gen_datapackage(package, datasets)
-        with open(
-            os.path.join(top_level_path, package, "datapackage.json"), "w"
-        ) as fptr:
-            json.dump(dp, fptr)
-    if "gambia" in packages:
-        if "noexist" in datasets:
-            # An invalid processor or dataset was placed in the tree
-            os.makedirs(
-                os.path.join(top_level_path, "gambia", "datasets", "noexist"),
-                exist_ok=True,
-            )
-        if "aqueduct" in datasets:
-            os.makedirs(
-                os.path.join(top_level_path, "gambia", "datasets", "aqueduct", "0.1"),
-                exist_ok=True,
-            )
-        if "biodiversity" in datasets:
-            os.makedirs(
-                os.path.join(
-                    top_level_path, "gambia", "datasets", "biodiversity", "version_1"
-                ),
-                exist_ok=True,
-            )
-        if "osm_roads" in datasets:
-            os.makedirs(
-                os.path.join(
-                    top_level_path, "gambia", "datasets", "osm_roads", "20221201"
-                ),
-                exist_ok=True,
-            )
-        if "natural_earth_raster" in datasets:
-            os.makedirs(
-                os.path.join(
-                    top_level_path,
-                    "gambia",
-                    "datasets",
-                    "natural_earth_raster",
-                    "version_1",
-                ),
-                exist_ok=True,
-            )
-    if "zambia" in packages:
-        if "osm_roads" in datasets:
-            os.makedirs(
-                os.path.join(
-                    top_level_path, "zambia", "datasets", "osm_roads", "20230401"
-                ),
-                exist_ok=True,
-            )
+        # Unbuffered write of the cached bytes (a single write unless it comes up short)
+        buf = memoryview(gen_datapackage_json(package, tuple(datasets)))
+        fd = os.open(
+            os.path.join(top_level_path, package, "datapackage.json"),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644,
+        )
+        try:
+            while buf:
+                buf = buf[os.write(fd, buf):]
+        finally:
+            os.close(fd)
+    _makedirs_batch(top_level_path, _test_tree_leaves(packages, datasets))
 
 
 def remove_tree(top_level_path: str, packages=["gambia", "zambia"]):
@@ -188,7 +308,7 @@ def remove_tree(top_level_path: str, packages=["gambia", "zambia"]):
     Cleanup the test tree from local FS
     """
     for package in packages:
-        shutil.rmtree(os.path.join(top_level_path, package), ignore_errors=True)
+        fast_rmtree(os.path.join(top_level_path, package), ignore_errors=True)
 
 
 def create_tree_awss3(
@@ -209,42 +329,12 @@ def create_tree_awss3(
             except FileNotFoundError:
                 pass
         s3_fs.create_dir(os.path.join(bucket, package))
-        dp = gen_datapackage(package, datasets)
         dp_fpath = os.path.join(bucket, package, "datapackage.json")
         with s3_fs.open_output_stream(dp_fpath) as stream:
-            stream.write(json.dumps(dp).encode())
-
-    if "gambia" in packages:
-        if "noexist" in datasets:
-            # An invalid processor or dataset was placed in the tree
-            s3_fs.create_dir(os.path.join(bucket, "gambia", "datasets", "noexist"))
-        if "aqueduct" in datasets:
-            s3_fs.create_dir(
-                os.path.join(bucket, "gambia", "datasets", "aqueduct", "0.1")
-            )
-        if "biodiversity" in datasets:
-            s3_fs.create_dir(
-                os.path.join(bucket, "gambia", "datasets", "biodiversity", "version_1")
-            )
-        if "osm_roads" in datasets:
-            s3_fs.create_dir(
-                os.path.join(bucket, "gambia", "datasets", "osm_roads", "20221201")
-            )
-        if "natural_earth_raster" in datasets:
-            s3_fs.create_dir(
-                os.path.join(
-                    bucket,
-                    "gambia",
-                    "datasets",
-                    "natural_earth_raster",
-                    "version_1",
-                )
-            )
-    if "zambia" in packages:
-        if "osm_roads" in datasets:
-            s3_fs.create_dir(
-                os.path.join(bucket, "zambia", "datasets", "osm_roads", "20230401")
-            )
+            stream.write(gen_datapackage_json(package, tuple(datasets)))
+
+    for leaf in _test_tree_leaves(packages, datasets):
+        s3_fs.create_dir(os.path.join(bucket, leaf))
 
 
 def remove_tree_awss3(
@@ -298,8 +388,7 @@ def assert_vector_output(
     if s3_fs and s3_vector_fpath:
         if not tmp_folder:
             local_vector_fpath = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)),
-                "data",
+                test_data_dir,
                 "processing",
                 os.path.basename(s3_vector_fpath),
             )
@@ -320,7 +409,7 @@ def assert_vector_output(
     )
 
 def assert_raster_output(
-    envelope: dict,
+    envelope: Union[dict, Tuple[float, float, float, float]],
     localfs_raster_fpath: str = None,
     s3_fs: S3FileSystem = None,
     s3_raster_fpath: str = None,
@@ -329,6 +418,7 @@ def assert_raster_output(
     tolerence: float = 0.1,
     tmp_folder: str = None,
     check_is_bigtiff: bool=False,
+    check_is_cog: bool=False,
     pixel_check_raster_fpath: str = None,
     pixel_check_num_samples: int = 100
 ):
@@ -348,8 +438,7 @@ def assert_raster_output(
         if s3_fs and s3_raster_fpath:
             if not tmp_folder:
                 localfs_raster_fpath = os.path.join(
-                    os.path.dirname(os.path.abspath(__file__)),
-                    "data",
+                    test_data_dir,
                     "processing",
                     os.path.basename(s3_raster_fpath),
                 )
@@ -363,24 +452,25 @@ def assert_raster_output(
                 source_filesystem=s3_fs,
                 destination_filesystem=fs.LocalFileSystem(),
             )
-        if pixel_check_raster_fpath is not None:
-            # Collect sample and coords from the first raster, then sample second raster
-            src_coords = sample_geotiff_coords(localfs_raster_fpath, pixel_check_num_samples)
-            _, expected_samples = sample_geotiff(pixel_check_raster_fpath, coords=src_coords)
-        else:
-            src_coords = None
-            expected_samples = None
-        assert_geotiff(
-            localfs_raster_fpath,
-            check_crs=check_crs,
-            check_compression=check_compression,
-            check_is_bigtiff=check_is_bigtiff,
-            check_pixel_coords=src_coords,
-            check_pixel_expected_samples=expected_samples
-        )
-        assert_raster_bounds_correct(
-            localfs_raster_fpath, envelope, tolerence=tolerence
-        )
+        # Single open of the output raster shared by all assertions
+        with open_raster(localfs_raster_fpath) as src:
+            if pixel_check_raster_fpath is not None:
+                # Collect sample and coords from the first raster, then sample second raster
+                src_coords = sample_geotiff_coords(src, pixel_check_num_samples)
+                _, expected_samples = sample_geotiff(pixel_check_raster_fpath, coords=src_coords)
+            else:
+                src_coords = None
+                expected_samples = None
+            assert_geotiff(
+                src,
+                check_crs=check_crs,
+                check_compression=check_compression,
+                check_is_bigtiff=check_is_bigtiff,
+                check_is_cog=check_is_cog,
+                check_pixel_coords=src_coords,
+                check_pixel_expected_samples=expected_samples
+            )
+            assert_raster_bounds_correct(src, envelope, tolerence=tolerence)
     finally:
         # Clean local S3 artifacts
         if s3_fs and s3_raster_fpath:
@@ -388,43 +478,85 @@ def assert_raster_output(
                 os.remove(localfs_raster_fpath)
 
 
+@lru_cache(maxsize=8)
+def _crs(crs: str):
+    """pyproj CRS for the given code, parsed once"""
+    import pyproj
+
+    return pyproj.CRS(crs)
+
+
+@lru_cache(maxsize=64)
+def _transformer(src: str, tgt: str):
+    """Transform function between the given CRS, built once per CRS pair"""
+    import pyproj
+
+    return pyproj.Transformer.from_crs(_crs(src), _crs(tgt), always_xy=True).transform
+
+
+@lru_cache(maxsize=32)
+def _envelope_bounds(envelope_geojson: str, crs: str) -> Tuple[float, float, float, float]:
+    """Bounds of the given (EPSG:4326) envelope geojson string, projected to crs"""
+    import shapely
+    from shapely.ops import transform
+
+    shape = shapely.from_geojson(envelope_geojson)
+    if crs != "EPSG:4326":
+        shape = transform(_transformer("EPSG:4326", crs), shape)
+    return shape.bounds
+
+
+def envelope_bounds(
+    envelope: Union[dict, Tuple[float, float, float, float]], crs: str = "EPSG:4326"
+) -> Tuple[float, float, float, float]:
+    """
+    Bounds (minx, miny, maxx, maxy) of a boundary envelope in the given CRS
+
+    Parsing and projection are cached per envelope / CRS,
+        so repeated raster assertions against one boundary are cheap
+
+    ::param envelope dict | tuple Geojson Dict of boundary envelope (Polygon)
+        or precomputed EPSG:4326 bounds
+    """
+    if isinstance(envelope, tuple):
+        if crs == "EPSG:4326":
+            return envelope
+        import shapely
+
+        return _envelope_bounds(shapely.to_geojson(shapely.box(*envelope)), crs)
+    return _envelope_bounds(json.dumps(envelope, sort_keys=True), crs)
+
+
 def assert_raster_bounds_correct(
-    raster_fpath: str, envelope: dict, tolerence: float = 0.1
+    raster_fpath: Union[str, rasterio.DatasetReader],
+    envelope: Union[dict, Tuple[float, float, float, float]],
+    tolerence: float = 0.1,
 ):
     """
     Check the bounds of the given raster match the given envelope (almost)
 
-    ::param envelope dict Geojson Dict of boundary envelope (Polygon)
+    ::param raster_fpath str | DatasetReader Absolute filepath or open rasterio dataset
+    ::param envelope dict | tuple Geojson Dict of boundary envelope (Polygon)
+        or its precomputed EPSG:4326 bounds (see envelope_bounds)
     """
-    with rasterio.open(raster_fpath) as src:
+    with open_raster(raster_fpath) as src:
         # Reproject bounds as necessary based on the source raster
         source_raster_epsg = ":".join(src.crs.to_authority())
         if source_raster_epsg != "EPSG:4326":
-            shape = shapely.from_geojson(json.dumps(envelope))
-            source_boundary_crs = pyproj.CRS("EPSG:4326")
-            target_boundary_crs = pyproj.CRS(source_raster_epsg)
-
-            project = pyproj.Transformer.from_crs(
-                source_boundary_crs, target_boundary_crs, always_xy=True
-            ).transform
-            shape = transform(project, shape)
-            x_coords, y_coords = shape.exterior.coords.xy
             tolerence = 1000.0
-        else:
-            x_coords = [i[0] for i in envelope["coordinates"][0]]
-            y_coords = [i[1] for i in envelope["coordinates"][0]]
+        minx, miny, maxx, maxy = envelope_bounds(envelope, crs=source_raster_epsg)
         assert (
-            abs(src.bounds.left - min(x_coords)) < tolerence
-        ), f"bounds {src.bounds.left} did not match expected {min(x_coords)} within tolerence {tolerence}"
+            abs(src.bounds.left - minx) < tolerence
+        ), f"bounds {src.bounds.left} did not match expected {minx} within tolerence {tolerence}"
         assert (
-            abs(src.bounds.right - max(x_coords)) < tolerence
-        ), f"bounds {src.bounds.right} did not match expected {max(x_coords)} within tolerence {tolerence}"
+            abs(src.bounds.right - maxx) < tolerence
+        ), f"bounds {src.bounds.right} did not match expected {maxx} within tolerence {tolerence}"
         assert (
-            abs(src.bounds.top - max(y_coords)) < tolerence
-        ), f"bounds {src.bounds.top} did not match expected {max(y_coords)} within tolerence {tolerence}"
+            abs(src.bounds.top - maxy) < tolerence
+        ), f"bounds {src.bounds.top} did not match expected {maxy} within tolerence {tolerence}"
         assert (
-            abs(src.bounds.bottom - min(y_coords)) < tolerence
-        ), f"bounds {src.bounds.bottom} did not match expected {min(y_coords)} within tolerence {tolerence}"
+            abs(src.bounds.bottom - miny) < tolerence
+        ), f"bounds {src.bounds.bottom} did not match expected {miny} within tolerence {tolerence}"
 
 
 def assert_exists_awss3(s3_fs: S3FileSystem, s3_raster_fpath: str):
@@ -437,6 +569,12 @@ def assert_exists_awss3(s3_fs: S3FileSystem, s3_raster_fpath: str):
     ), f"file was not found on S3 {s3_raster_fpath}"
 
 
+def _subdirs(folder_path: str) -> List[str]:
+    """Names of the immediate subfolders of the given folder"""
+    with os.scandir(folder_path) as it:
+        return [entry.name for entry in it if entry.is_dir(follow_symlinks=False)]
+
+
 def assert_package(top_level_fpath: str, boundary_name: str):
     """Assert integrity of a package and datasets contained within
     This does not assert the integrity of actualy data files (raster/vector);
@@ -449,25 +587,20 @@ def assert_package(top_level_fpath: str, boundary_name: str):
         "provenance.json",
         "datapackage.json",
     ]
-    packages = next(os.walk(top_level_fpath))[1]
+    packages = _subdirs(top_level_fpath)
     assert (
         boundary_name in packages
     ), f"{boundary_name} missing in package root: {packages}"
-    for dataset in next(
-        os.walk(os.path.join(top_level_fpath, boundary_name, "datasets"))
-    )[1]:
-        for version in next(
-            os.walk(os.path.join(top_level_fpath, boundary_name, "datasets", dataset))
-        )[1]:
-            chk_path = os.path.join(
-                top_level_fpath, boundary_name, "datasets", dataset, version
-            )
+    datasets_path = os.path.join(top_level_fpath, boundary_name, "datasets")
+    for dataset in _subdirs(datasets_path):
+        for version in _subdirs(os.path.join(datasets_path, dataset)):
+            chk_path = os.path.join(datasets_path, dataset, version)
             assert os.path.exists(chk_path), f"missing files in package: {chk_path}"
-    # Ensure the top-level index and other docs exist
+    # Ensure the top-level index and other docs exist (single listing of the boundary folder)
+    with os.scandir(os.path.join(top_level_fpath, boundary_name)) as it:
+        boundary_files = {entry.name for entry in it}
     for doc in required_top_level_docs:
-        assert os.path.exists(
-            os.path.join(top_level_fpath, boundary_name, doc)
-        ), f"top-level {doc} missing"
+        assert doc in boundary_files, f"top-level {doc} missing"
 
 def assert_package_awss3(awss3_backend: AWSS3StorageBackend, boundary_name: str, expected_processor_versions: List=[]):
     """Assert integrity of a package and datasets contained within (on S3)
@@ -502,9 +635,10 @@ def assert_table_in_pg(db_uri: str, tablename: str):
     """Check a given table exists in PG"""
     from sqlalchemy.sql import text
 
-    engine = sa.create_engine(db_uri, pool_pre_ping=True)
-    stmt = text(f'SELECT * FROM "{tablename}"')
-    engine.execute(stmt)
+    # LIMIT 0 fails for a missing table without reading any rows
+    stmt = text(f'SELECT * FROM "{tablename}" LIMIT 0')
+    with engine_for(db_uri).connect() as conn:
+        conn.execute(stmt)
 
 
 def setup_test_data_paths(processor: Any, test_processing_data_dir: str):